@@ -1,3 +1,4 @@
+import math
 import pygame
 
 class Camera:
@@ -12,6 +13,12 @@ class Camera:
         # Scale to fill screen completely (may stretch slightly)
         self.scale_x = screen_width / self.view_width
         self.scale_y = screen_height / self.view_height
+        self.inv_scale_x = self.view_width / screen_width
+        self.inv_scale_y = self.view_height / screen_height
+        
+        # Half view size (used for centering on a target)
+        self.half_view_width = self.view_width * 0.5
+        self.half_view_height = self.view_height * 0.5
         
         # Camera position in world
         self.x = 0
@@ -39,11 +46,13 @@ class Camera:
             self._update_transition(dt)
             return
         
-        target_cam_x = target_x - self.view_width / 2
-        target_cam_y = target_y - self.view_height / 2
+        target_cam_x = target_x - self.half_view_width
+        target_cam_y = target_y - self.half_view_height
         
-        self.x += (target_cam_x - self.x) * self.lerp_speed * dt
-        self.y += (target_cam_y - self.y) * self.lerp_speed * dt
+        # Frame-rate independent exponential smoothing
+        alpha = 1.0 - math.exp(-self.lerp_speed * dt)
+        self.x += (target_cam_x - self.x) * alpha
+        self.y += (target_cam_y - self.y) * alpha
         
         self._clamp_to_bounds()
     
@@ -109,10 +118,14 @@ class Camera:
                 self.on_transition_complete = None
             return
         
-        t = 1 - (1 - self.transition_progress) ** 3
+        # Cubic ease-out
+        u = 1 - self.transition_progress
+        t = 1 - u * u * u
         
-        self.x = self.transition_start[0] + (self.transition_target[0] - self.transition_start[0]) * t
-        self.y = self.transition_start[1] + (self.transition_target[1] - self.transition_start[1]) * t
+        start_x, start_y = self.transition_start
+        target_x, target_y = self.transition_target
+        self.x = start_x + (target_x - start_x) * t
+        self.y = start_y + (target_y - start_y) * t
     
     def world_to_screen(self, world_pos):
         screen_x = (world_pos[0] - self.x) * self.scale_x
@@ -123,12 +136,16 @@ class Camera:
         return self.world_to_screen(world_pos)
     
     def apply_rect(self, rect):
-        x, y = self.world_to_screen((rect.x, rect.y))
-        w = rect.width * self.scale_x
-        h = rect.height * self.scale_y
-        return pygame.Rect(x, y, w, h)
+        sx = self.scale_x
+        sy = self.scale_y
+        return pygame.Rect(
+            int((rect.x - self.x) * sx),
+            int((rect.y - self.y) * sy),
+            int(rect.width * sx),
+            int(rect.height * sy)
+        )
     
     def screen_to_world(self, screen_pos):
-        world_x = screen_pos[0] / self.scale_x + self.x
-        world_y = screen_pos[1] / self.scale_y + self.y
+        world_x = screen_pos[0] * self.inv_scale_x + self.x
+        world_y = screen_pos[1] * self.inv_scale_y + self.y
         return (world_x, world_y)
\ No newline at end of file
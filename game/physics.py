@@ -2,6 +2,8 @@
 import math
 import pygame
 
+from .room import TILE_SOLID, TILE_GRAPPLE, TILE_PLATFORM
+
 # =============================================================================
 # PHYSICS CONSTANTS - Balanced for good feel
 # =============================================================================
@@ -35,18 +37,30 @@ GRAPPLE_FIRE_SPEED = 2000
 GRAPPLE_MAX_RANGE = 450
 GRAPPLE_PULL_FORCE = 2800
 GRAPPLE_PULL_MAX_SPEED = 900
+GRAPPLE_PULL_MAX_SPEED_SQ = GRAPPLE_PULL_MAX_SPEED * GRAPPLE_PULL_MAX_SPEED
 GRAPPLE_MIN_PULL_DIST = 32
+GRAPPLE_MIN_PULL_DIST_SQ = GRAPPLE_MIN_PULL_DIST * GRAPPLE_MIN_PULL_DIST
 GRAPPLE_RELEASE_BOOST = 1.2
 PREFERRED_ROPE_LENGTH = 180
 
+# Tiles the hook can latch onto
+GRAPPLE_HIT_TILES = (TILE_SOLID, TILE_GRAPPLE, TILE_PLATFORM)
+
+
+# Module-level bindings for math functions used in per-frame code
+_sqrt = math.sqrt
+_sin = math.sin
+_cos = math.cos
+_atan2 = math.atan2
+
 
 # =============================================================================
 # UTILITY FUNCTIONS
 # =============================================================================
 
-def apply_gravity(vy, dt):
+def apply_gravity(vy, dt, _g=GRAVITY, _tv=TERMINAL_VELOCITY, _min=min):
     """Apply gravity, return new velocity capped at terminal velocity"""
-    return min(vy + GRAVITY * dt, TERMINAL_VELOCITY)
+    return _min(vy + _g * dt, _tv)
 
 
 def sign(x):
@@ -71,7 +85,7 @@ def distance(x1, y1, x2, y2):
     """Distance between two points"""
     dx = x2 - x1
     dy = y2 - y1
-    return math.sqrt(dx * dx + dy * dy)
+    return _sqrt(dx * dx + dy * dy)
 
 
 # =============================================================================
@@ -92,6 +106,10 @@ class GrappleHook:
     )
     
     def __init__(self):
+        self.reset()
+    
+    def reset(self):
+        """Drop any hook and return to the inactive state."""
         self.state = "inactive"
         self.hook_x = 0.0
         self.hook_y = 0.0
@@ -114,7 +132,7 @@ class GrappleHook:
         
         dx = target_x - start_x
         dy = target_y - start_y
-        dist = math.sqrt(dx * dx + dy * dy)
+        dist = _sqrt(dx * dx + dy * dy)
         
         if dist < 20:
             return False
@@ -188,15 +206,8 @@ class GrappleHook:
             # Check for hit at this step
             hook_rect = pygame.Rect(int(current_x) - 2, int(current_y) - 2, 4, 4)
             
-            valid_hit = False
-            
-            # 1. Check TILES
-            collisions = room_manager.get_collisions(hook_rect)
-            for tile in collisions:
-                # tile_type: 1=solid, 3=grapple, 5=platform
-                if tile.tile_type in (TILE_SOLID, TILE_GRAPPLE, TILE_PLATFORM):
-                    valid_hit = True
-                    break
+            # 1. Check TILES (solid, grapple, platform)
+            valid_hit = room_manager.first_collision(hook_rect, GRAPPLE_HIT_TILES) is not None
             
             # 2. Check OBJECTS (Pixel Perfect)
             if not valid_hit:
@@ -234,12 +245,12 @@ class GrappleHook:
                 
                 dx = px - self.anchor_x
                 dy = py - self.anchor_y
-                self.angle = math.atan2(dx, dy)
+                self.angle = _atan2(dx, dy)
                 
                 # Convert velocity to angular
                 if self.rope_length > 10:
-                    tangent_x = math.cos(self.angle)
-                    tangent_y = -math.sin(self.angle)
+                    tangent_x = _cos(self.angle)
+                    tangent_y = -_sin(self.angle)
                     tangent_vel = player.vx * tangent_x + player.vy * tangent_y
                     self.angular_velocity = tangent_vel / self.rope_length
                 else:
@@ -265,15 +276,17 @@ class GrappleHook:
         
         dx = self.anchor_x - px
         dy = self.anchor_y - py
-        dist = math.sqrt(dx * dx + dy * dy)
+        dist_sq = dx * dx + dy * dy
         
-        if dist < GRAPPLE_MIN_PULL_DIST:
+        if dist_sq < GRAPPLE_MIN_PULL_DIST_SQ:
             # Reached target
             boost_vx, boost_vy = self.release()
             player.vx = boost_vx
             player.vy = boost_vy
             return
         
+        dist = _sqrt(dist_sq)
+        
         # Direction to anchor
         dir_x = dx / dist
         dir_y = dy / dist
@@ -287,10 +300,10 @@ class GrappleHook:
         player.vx += dir_x * strength * dt
         player.vy += dir_y * strength * dt
         
-        # Cap speed
-        speed = math.sqrt(player.vx * player.vx + player.vy * player.vy)
-        if speed > GRAPPLE_PULL_MAX_SPEED:
-            scale = GRAPPLE_PULL_MAX_SPEED / speed
+        # Cap speed (compare squared, only take the root when capping)
+        speed_sq = player.vx * player.vx + player.vy * player.vy
+        if speed_sq > GRAPPLE_PULL_MAX_SPEED_SQ:
+            scale = GRAPPLE_PULL_MAX_SPEED / _sqrt(speed_sq)
             player.vx *= scale
             player.vy *= scale
         
@@ -299,24 +312,28 @@ class GrappleHook:
     
     def _update_swing(self, dt, player, room_manager):
         """Swing mode - pendulum physics."""
-        gravity_accel = -GRAVITY / max(self.rope_length, 50) * math.sin(self.angle)
+        rope_length = self.rope_length
+        gravity_accel = -GRAVITY / max(rope_length, 50) * _sin(self.angle)
         
         self.angular_velocity += gravity_accel * dt
         self.angular_velocity *= 0.997
         self.angle += self.angular_velocity * dt
         
-        new_x = self.anchor_x + math.sin(self.angle) * self.rope_length - player.width / 2
-        new_y = self.anchor_y + math.cos(self.angle) * self.rope_length - player.height / 2
+        sin_a = _sin(self.angle)
+        cos_a = _cos(self.angle)
+        
+        new_x = self.anchor_x + sin_a * rope_length - player.width / 2
+        new_y = self.anchor_y + cos_a * rope_length - player.height / 2
         
         test_rect = pygame.Rect(int(new_x), int(new_y), player.width, player.height)
-        if not room_manager.get_collisions(test_rect):
+        if room_manager.first_collision(test_rect) is None:
             player.x = new_x
             player.y = new_y
         else:
             self.angular_velocity *= -0.4
         
-        player.vx = self.angular_velocity * self.rope_length * math.cos(self.angle)
-        player.vy = -self.angular_velocity * self.rope_length * math.sin(self.angle)
+        player.vx = self.angular_velocity * rope_length * cos_a
+        player.vy = -self.angular_velocity * rope_length * sin_a
         
         self._pull_vx = player.vx
         self._pull_vy = player.vy
@@ -342,6 +359,16 @@ class GrappleHook:
             return
         
         px, py = player.center
+        if self.state == "firing":
+            hx, hy = self.hook_x, self.hook_y
+        else:
+            hx, hy = self.anchor_x, self.anchor_y
+        
+        # Cull when the whole rope is outside the camera view
+        if (max(px, hx) < camera.x or min(px, hx) > camera.x + camera.view_width or
+                max(py, hy) < camera.y or min(py, hy) > camera.y + camera.view_height):
+            return
+        
         start = camera.apply((px, py))
         
         if self.state == "firing":
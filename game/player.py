@@ -28,7 +28,27 @@ class Player:
     - One-way platform support
     """
     
+    __slots__ = (
+        'x', 'y', 'width', 'height', 'vx', 'vy',
+        'speed', 'accel', 'decel', 'air_accel', 'air_decel',
+        'on_ground', 'coyote_timer', 'jump_buffer_timer', 'jump_held',
+        'jump_released_midair', 'drop_through_platforms', 'last_y',
+        'wall_dir', 'wall_jump_locked', 'wall_jump_lock_timer',
+        'sprinting', 'rolling',
+        'move_mode', 'auto_target_x', 'auto_target_y', 'auto_move_callback',
+        'arc_start', 'arc_target', 'arc_control', 'arc_timer', 'arc_duration',
+        'roll_timer', 'roll_cooldown', 'roll_dir', 'roll_was_pressed',
+        'grapple', 'grapple_was_pressed', 'facing_right',
+        'frozen', 'transition_dir', 'transition_slid', 'transition_slide',
+        'on_exit', 'exit_direction', 'dead'
+    )
+    
     def __init__(self, x, y):
+        self.grapple = GrappleHook()
+        self.reset(x, y)
+    
+    def reset(self, x, y):
+        """Return to the initial state at (x, y), reusing the grapple object."""
         self.x = float(x)
         self.y = float(y)
         self.width = 24
@@ -84,7 +104,7 @@ class Player:
         self.roll_was_pressed = False
         
         # Grapple
-        self.grapple = GrappleHook()
+        self.grapple.reset()
         self.grapple_was_pressed = False
         
         # Visual
@@ -750,25 +770,25 @@ class Player:
         else:
             color = (100, 220, 120)
         
-        # Draw player
-        screen_rect = camera.apply_rect(self.rect)
+        # Draw player (screen rect as ints, same maths as Camera.apply_rect)
+        scale_x, scale_y = camera.scale_x, camera.scale_y
+        left = int((int(self.x) - camera.x) * scale_x)
+        top = int((int(self.y) - camera.y) * scale_y)
+        w = int(self.width * scale_x)
+        h = int(self.height * scale_y)
+        right = left + w
+        bottom = top + h
         
         if self.rolling:
             # Squish effect during roll
             squish = 0.7
-            roll_rect = pygame.Rect(
-                screen_rect.x,
-                screen_rect.y + screen_rect.height * (1 - squish) / 2,
-                screen_rect.width * 1.2,
-                screen_rect.height * squish
-            )
-            pygame.draw.rect(surface, color, roll_rect)
+            pygame.draw.rect(surface, color, (left, top + h * (1 - squish) / 2, w * 1.2, h * squish))
         else:
-            pygame.draw.rect(surface, color, screen_rect)
+            pygame.draw.rect(surface, color, (left, top, w, h))
         
         # Facing indicator (not during roll)
         if not self.rolling:
-            cx, cy = screen_rect.centerx, screen_rect.centery
+            cx, cy = left + w // 2, top + h // 2
             if self.facing_right:
                 points = [(cx + 7, cy), (cx + 1, cy - 4), (cx + 1, cy + 4)]
             else:
@@ -778,12 +798,12 @@ class Player:
         # Wall slide indicator
         if self.wall_dir != 0 and not self.on_ground and not self.rolling:
             for i in range(3):
-                py = screen_rect.top + 4 + i * 6
-                px = screen_rect.left - 2 if self.wall_dir < 0 else screen_rect.right + 2
+                py = top + 4 + i * 6
+                px = left - 2 if self.wall_dir < 0 else right + 2
                 pygame.draw.line(surface, (200, 200, 255), (px, py), (px, py + 3), 2)
         
         # Sprint particles (simple trailing effect)
         if self.sprinting and self.on_ground and abs(self.vx) > 200:
-            trail_x = screen_rect.centerx - sign(self.vx) * 15
-            trail_y = screen_rect.bottom - 4
+            trail_x = left + w // 2 - sign(self.vx) * 15
+            trail_y = bottom - 4
             pygame.draw.circle(surface, (150, 255, 150), (int(trail_x), int(trail_y)), 3)
\ No newline at end of file
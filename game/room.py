@@ -1,6 +1,12 @@
 import pygame
-import json
 import os
+from itertools import islice, repeat
+
+# orjson is optional; it parses room/world files several times faster
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
 
 # Tile types
 TILE_EMPTY = 0
@@ -11,6 +17,29 @@ TILE_EXIT = 4
 TILE_PLATFORM = 5
 OBJ_PLATFORM = "platform"
 
+# Tiled tile ids that map to a known tile type; anything else loads as solid
+TILED_TILE_TYPES = {
+    0: TILE_EMPTY,
+    1: TILE_SOLID,
+    2: TILE_SPIKE,
+    3: TILE_GRAPPLE,
+    4: TILE_EXIT,
+    5: TILE_PLATFORM,
+}
+
+# Collision broadphase: bucket size in tiles, and the rect count below
+# which a plain linear scan is cheaper than bucketing
+COLLISION_BUCKET_TILES = 8
+COLLISION_BUCKET_MIN_RECTS = 32
+
+# Rooms are pre-rendered at screen scale unless that surface would be
+# larger than this on either side, in which case tiles are drawn per frame
+BAKE_MAX_SIZE = 4096
+BAKE_COLORKEY = (255, 0, 255)
+
+# bytes.translate table turning a tile grid into 1 for solid, 0 otherwise
+SOLID_MASK_TABLE = bytes(1 if i == TILE_SOLID else 0 for i in range(256))
+
 TILE_COLORS = {
     TILE_EMPTY: None,
     TILE_SOLID: (60, 60, 70),
@@ -45,23 +74,44 @@ class Room:
         self.width = 20   # tiles
         self.height = 12  # tiles
         self.tile_size = 32
-        self.tiles = []
+        # Flat row-major tile grid, one byte per tile: tiles[y * width + x]
+        self.tiles = bytearray()
         
         # Pixel bounds in world space
         self.bounds = None
+        # Bounds grown by a margin, used to find rooms near a query rect
+        self.query_bounds = None
         
         # Spawn point (local to room)
         self.spawn = None
         
-        # Room Objects
+        # Room Objects (and their world rects, in the same order)
         self.objects = []
+        self.object_rects = []
+        
+        # Cached Tile per grid cell (None for empty), parallel to self.tiles
+        self.tile_cache = []
+        
+        # Solid tiles merged into as few world-space rects as possible
+        self.collision_rects = []
+        
+        # Tile layer pre-rendered at camera scale, and the scale it was built for
+        self._baked = None
+        self._baked_scale = None
+        
+        # Coarse grid over collision_rects: (bucket_x, bucket_y) -> [Rect]
+        self._bucket_size = 0
+        self._buckets = None
+        
+        # Rooms whose bounds reach into query_bounds (set by RoomManager)
+        self.neighbors = []
         
         self._load(filepath)
     
     def _load(self, filepath):
         """Load room from JSON file (exported from Tiled)."""
-        with open(filepath, 'r') as f:
-            data = json.load(f)
+        with open(filepath, 'rb') as f:
+            data = json_loads(f.read())
         
         self.width = data.get('width', 20)
         self.height = data.get('height', 12)
@@ -71,12 +121,13 @@ class Room:
         pixel_width = self.width * self.tile_size
         pixel_height = self.height * self.tile_size
         self.bounds = pygame.Rect(self.world_x, self.world_y, pixel_width, pixel_height)
+        self.query_bounds = self.bounds.inflate(64, 64)
         
         # Initialize empty tiles
-        self.tiles = [[TILE_EMPTY] * self.width for _ in range(self.height)]
+        self.tiles = bytearray(self.width * self.height)
         
         # Parse layers
-        for layer in data.get('layers', []):
+        for layer in data.pop('layers', []):
             layer_type = layer.get('type', '')
             layer_name = layer.get('name', '').lower()
             
@@ -84,31 +135,91 @@ class Room:
                 self._parse_tiles(layer)
             elif layer_type == 'objectgroup':
                 self._parse_objects(layer)
+        
+        self._build_tile_cache()
+        self._build_collision_rects()
+        self._build_collision_buckets()
     
     def _parse_tiles(self, layer):
         """Parse tile layer data."""
-        tile_data = layer.get('data', [])
+        # Popped so the parsed id list is freed before the caches are built
+        tile_data = layer.pop('data', [])
+        count = min(len(tile_data), len(self.tiles))
+        
+        # Tiled uses 0 for empty, 1+ for tiles; map the whole layer in one pass
+        self.tiles[:count] = bytes(map(TILED_TILE_TYPES.get, islice(tile_data, count), repeat(TILE_SOLID, count)))
+    
+    def _build_tile_cache(self):
+        """Build one Tile (with its world-space rect) per non-empty cell."""
+        ts = self.tile_size
+        width = self.width
+        cache = [None] * len(self.tiles)
+        for idx, tile_type in enumerate(self.tiles):
+            if tile_type != TILE_EMPTY:
+                y, x = divmod(idx, width)
+                rect = pygame.Rect(self.world_x + x * ts, self.world_y + y * ts, ts, ts)
+                cache[idx] = Tile(rect, tile_type)
+        self.tile_cache = cache
+    
+    def _build_collision_rects(self):
+        """
+        Merge solid tiles into larger rects: first horizontal runs per row,
+        then runs with the same x/width in consecutive rows are stacked.
+        """
+        ts = self.tile_size
+        width = self.width
+        # Runs are located with bytes.find on a 0/1 solid mask, not per cell
+        solid = self.tiles.translate(SOLID_MASK_TABLE)
+        find = solid.find
+        merged = []
+        open_spans = {}  # (x_start, length) -> [x, y, w, h] in tiles
         
         for y in range(self.height):
-            for x in range(self.width):
-                idx = y * self.width + x
-                if idx < len(tile_data):
-                    tile_id = tile_data[idx]
-                    # Tiled uses 0 for empty, 1+ for tiles
-                    if tile_id == 0:
-                        self.tiles[y][x] = TILE_EMPTY
-                    elif tile_id == 1:
-                        self.tiles[y][x] = TILE_SOLID
-                    elif tile_id == 2:
-                        self.tiles[y][x] = TILE_SPIKE
-                    elif tile_id == 3:
-                        self.tiles[y][x] = TILE_GRAPPLE
-                    elif tile_id == 4:
-                        self.tiles[y][x] = TILE_EXIT
-                    elif tile_id == 5:
-                        self.tiles[y][x] = TILE_PLATFORM
-                    else:
-                        self.tiles[y][x] = TILE_SOLID
+            row_start = y * width
+            row_end = row_start + width
+            row_spans = {}
+            run_start = find(1, row_start, row_end)
+            while run_start != -1:
+                run_end = find(0, run_start, row_end)
+                if run_end == -1:
+                    run_end = row_end
+                key = (run_start - row_start, run_end - run_start)
+                span = open_spans.pop(key, None)
+                if span is None:
+                    span = [key[0], y, key[1], 0]
+                span[3] += 1
+                row_spans[key] = span
+                run_start = find(1, run_end, row_end)
+            
+            # Spans not continued on this row are finished
+            merged.extend(open_spans.values())
+            open_spans = row_spans
+        merged.extend(open_spans.values())
+        
+        self.collision_rects = [
+            pygame.Rect(self.world_x + x * ts, self.world_y + y * ts, w * ts, h * ts)
+            for x, y, w, h in merged
+        ]
+    
+    def _build_collision_buckets(self):
+        """Insert each collision rect into every grid bucket it overlaps."""
+        if len(self.collision_rects) < COLLISION_BUCKET_MIN_RECTS:
+            self._buckets = None
+            return
+        
+        size = self.tile_size * COLLISION_BUCKET_TILES
+        buckets = {}
+        for rect in self.collision_rects:
+            left = (rect.left - self.world_x) // size
+            right = (rect.right - 1 - self.world_x) // size
+            top = (rect.top - self.world_y) // size
+            bottom = (rect.bottom - 1 - self.world_y) // size
+            for by in range(top, bottom + 1):
+                for bx in range(left, right + 1):
+                    buckets.setdefault((bx, by), []).append(rect)
+        
+        self._bucket_size = size
+        self._buckets = buckets
     
     def _parse_objects(self, layer):
         """Parse object layer for spawn point and game objects."""
@@ -130,9 +241,9 @@ class Room:
                 h = obj.get('height', 16)
                 
                 new_obj = RoomObject(x, y, w, h, obj_type)
-                new_obj.world_x = self.world_x + x
-                new_obj.world_y = self.world_y + y
+                new_obj.set_world_position(self.world_x + x, self.world_y + y)
                 self.objects.append(new_obj)
+                self.object_rects.append(new_obj.rect)
     
     def get_spawn_world(self):
         """Get spawn point in world coordinates."""
@@ -155,65 +266,154 @@ class Room:
         local_right = rect.right - self.world_x
         local_bottom = rect.bottom - self.world_y
         
-        start_x = max(0, int(local_left // self.tile_size) - 1)
-        end_x = min(self.width, int(local_right // self.tile_size) + 2)
-        start_y = max(0, int(local_top // self.tile_size) - 1)
-        end_y = min(self.height, int(local_bottom // self.tile_size) + 2)
+        # Only tiles from the one containing the left/top edge to the one
+        # containing the right/bottom edge can overlap
+        start_x = max(0, int(local_left // self.tile_size))
+        end_x = min(self.width, int(local_right // self.tile_size) + 1)
+        start_y = max(0, int(local_top // self.tile_size))
+        end_y = min(self.height, int(local_bottom // self.tile_size) + 1)
         
+        cache = self.tile_cache
+        width = self.width
+        colliderect = rect.colliderect
         for y in range(start_y, end_y):
-            for x in range(start_x, end_x):
-                tile_type = self.tiles[y][x]
+            row_start = y * width
+            for tile in cache[row_start + start_x:row_start + end_x]:
                 # Return ALL non-empty tiles (spikes, grapple, exit, solid, platform)
-                if tile_type != TILE_EMPTY:
-                    tile_rect = pygame.Rect(
-                        self.world_x + x * self.tile_size,
-                        self.world_y + y * self.tile_size,
-                        self.tile_size,
-                        self.tile_size
-                    )
-                    if rect.colliderect(tile_rect):
-                        results.append(Tile(tile_rect, tile_type))
+                if tile is not None and colliderect(tile.rect):
+                    results.append(tile)
         
         return results
 
-    def get_object_collisions(self, rect):
-        """Get object collisions for a world-space rect."""
-        results = []
-        for obj in self.objects:
-            # Simple AABB check first
-            if rect.colliderect(obj.rect):
-                results.append(obj)
-        return results
-    
-    def get_solid_collisions(self, rect):
-        """Get only solid tile collisions (no platforms)."""
-        results = []
-        
+    def first_collision(self, rect, tile_types=None):
+        """
+        Return the first non-empty tile overlapping rect (world coords), or None.
+        If tile_types is given, only tiles of those types count.
+        Allocates nothing.
+        """
+        tile_size = self.tile_size
         local_left = rect.left - self.world_x
         local_top = rect.top - self.world_y
         local_right = rect.right - self.world_x
         local_bottom = rect.bottom - self.world_y
         
-        start_x = max(0, int(local_left // self.tile_size) - 1)
-        end_x = min(self.width, int(local_right // self.tile_size) + 2)
-        start_y = max(0, int(local_top // self.tile_size) - 1)
-        end_y = min(self.height, int(local_bottom // self.tile_size) + 2)
+        start_x = max(0, int(local_left // tile_size))
+        end_x = min(self.width, int(local_right // tile_size) + 1)
+        start_y = max(0, int(local_top // tile_size))
+        end_y = min(self.height, int(local_bottom // tile_size) + 1)
         
+        tiles = self.tiles
+        width = self.width
         for y in range(start_y, end_y):
+            tile_top = y * tile_size
+            if not (local_top < tile_top + tile_size and local_bottom > tile_top):
+                continue
+            row_start = y * width
             for x in range(start_x, end_x):
-                if self.tiles[y][x] == TILE_SOLID:
-                    tile_rect = pygame.Rect(
-                        self.world_x + x * self.tile_size,
-                        self.world_y + y * self.tile_size,
-                        self.tile_size,
-                        self.tile_size
-                    )
-                    if rect.colliderect(tile_rect):
-                        results.append(tile_rect)
+                tile_type = tiles[row_start + x]
+                if tile_type == TILE_EMPTY:
+                    continue
+                if tile_types is not None and tile_type not in tile_types:
+                    continue
+                tile_left = x * tile_size
+                if local_left < tile_left + tile_size and local_right > tile_left:
+                    return self.tile_cache[row_start + x]
+        return None
+    
+    def get_object_collisions(self, rect):
+        """Get object collisions for a world-space rect."""
+        objects = self.objects
+        return [objects[i] for i in rect.collidelistall(self.object_rects)]
+    
+    def get_solid_collisions(self, rect):
+        """Get merged solid collision rects overlapping rect (no platforms)."""
+        buckets = self._buckets
+        if buckets is None:
+            # collidelistall runs the whole AABB test in C
+            rects = self.collision_rects
+            return [rects[i] for i in rect.collidelistall(rects)]
+        
+        size = self._bucket_size
+        left = (rect.left - self.world_x) // size
+        right = (rect.right - 1 - self.world_x) // size
+        top = (rect.top - self.world_y) // size
+        bottom = (rect.bottom - 1 - self.world_y) // size
         
+        results = []
+        seen = set()
+        for by in range(top, bottom + 1):
+            for bx in range(left, right + 1):
+                bucket = buckets.get((bx, by))
+                if not bucket:
+                    continue
+                for i in rect.collidelistall(bucket):
+                    r = bucket[i]
+                    if id(r) not in seen:
+                        seen.add(id(r))
+                        results.append(r)
         return results
     
+    def _bake(self, scale_x, scale_y):
+        """
+        Render the whole tile layer once at the given camera scale.
+        Returns None if the surface would exceed BAKE_MAX_SIZE.
+        """
+        ts = self.tile_size
+        bake_w = int(self.width * ts * scale_x)
+        bake_h = int(self.height * ts * scale_y)
+        if bake_w > BAKE_MAX_SIZE or bake_h > BAKE_MAX_SIZE:
+            return None
+        
+        baked = pygame.Surface((bake_w, bake_h))
+        if pygame.display.get_surface():
+            baked = baked.convert()
+        baked.fill(BAKE_COLORKEY)
+        baked.set_colorkey(BAKE_COLORKEY)
+        
+        tile_w = int(ts * scale_x)
+        tile_h = int(ts * scale_y)
+        line_h = max(1, int(4 * scale_y))
+        for tile in self.tile_cache:
+            if tile is None:
+                continue
+            color = TILE_COLORS.get(tile.tile_type, (100, 100, 100))
+            if not color:
+                continue
+            x = int((tile.rect.x - self.world_x) * scale_x)
+            y = int((tile.rect.y - self.world_y) * scale_y)
+            baked.fill(color, (x, y, tile_w, tile_h))
+            if tile.tile_type == TILE_PLATFORM:
+                baked.fill((120, 100, 70), (x, y, tile_w, line_h))
+        return baked
+    
     def draw(self, surface, camera):
+        """Draw the room's tiles and objects."""
+        bounds = self.bounds
+        if (bounds.right <= camera.x or bounds.left >= camera.x + camera.view_width or
+                bounds.bottom <= camera.y or bounds.top >= camera.y + camera.view_height):
+            return
+        
+        scale = (camera.scale_x, camera.scale_y)
+        if self._baked_scale != scale:
+            self._baked = self._bake(*scale)
+            self._baked_scale = scale
+        
+        if self._baked is not None:
+            # Blit only the part of the pre-rendered room that is on screen
+            dest_x = int((self.world_x - camera.x) * camera.scale_x)
+            dest_y = int((self.world_y - camera.y) * camera.scale_y)
+            src_x = max(0, -dest_x)
+            src_y = max(0, -dest_y)
+            area = (src_x, src_y, surface.get_width(), surface.get_height())
+            surface.blit(self._baked, (dest_x + src_x, dest_y + src_y), area)
+        else:
+            self._draw_tiles(surface, camera)
+        
+        # Draw Objects
+        for obj in self.objects:
+            obj.draw(surface, camera)
+    
+    def _draw_tiles(self, surface, camera):
         """Draw visible tiles (Optimized viewport culling)."""
         # 1. Viewport Culling: Only draw tiles strictly inside the camera view
         # Convert camera top-left to tile coordinates
@@ -225,32 +425,41 @@ class Room:
         end_col = int(min(self.width, (camera.x + camera.view_width - self.world_x) // self.tile_size + 1))
         end_row = int(min(self.height, (camera.y + camera.view_height - self.world_y) // self.tile_size + 1))
         
+        # 2. Batch screen rects by tile type, then fill each batch in one pass
+        cam_x, cam_y = camera.x, camera.y
+        scale_x, scale_y = camera.scale_x, camera.scale_y
+        tile_w = int(self.tile_size * scale_x)
+        tile_h = int(self.tile_size * scale_y)
+        
+        batches = {}
+        cache = self.tile_cache
         for y in range(start_row, end_row):
+            row_start = y * self.width
             for x in range(start_col, end_col):
-                tile_type = self.tiles[y][x]
-                if tile_type == TILE_EMPTY:
+                tile = cache[row_start + x]
+                if tile is None:
                     continue
-                
-                # World position of this tile
-                world_x = self.world_x + x * self.tile_size
-                world_y = self.world_y + y * self.tile_size
-                
-                # Screen position
-                screen_rect = camera.apply_rect(pygame.Rect(world_x, world_y, self.tile_size, self.tile_size))
-                
-                color = TILE_COLORS.get(tile_type, (100, 100, 100))
-                
-                if color:
-                    pygame.draw.rect(surface, color, screen_rect)
-                    
-                    if tile_type == TILE_PLATFORM:
-                        # Draw platform top detail
-                        top_line = pygame.Rect(screen_rect.x, screen_rect.y, screen_rect.width, max(1, int(4 * camera.scale_y)))
-                        pygame.draw.rect(surface, (120, 100, 70), top_line)
-        
-        # Draw Objects
-        for obj in self.objects:
-            obj.draw(surface, camera)
+                rect = tile.rect
+                screen_rect = (int((rect.x - cam_x) * scale_x), int((rect.y - cam_y) * scale_y), tile_w, tile_h)
+                batch = batches.get(tile.tile_type)
+                if batch is None:
+                    batches[tile.tile_type] = [screen_rect]
+                else:
+                    batch.append(screen_rect)
+        
+        fill = surface.fill
+        for tile_type, rects in batches.items():
+            color = TILE_COLORS.get(tile_type, (100, 100, 100))
+            if color:
+                for screen_rect in rects:
+                    fill(color, screen_rect)
+        
+        # Platform top detail goes over the platform fill
+        platforms = batches.get(TILE_PLATFORM)
+        if platforms:
+            line_h = max(1, int(4 * scale_y))
+            for px, py, pw, _ in platforms:
+                fill((120, 100, 70), (px, py, pw, line_h))
 
 
 class RoomObject:
@@ -263,16 +472,22 @@ class RoomObject:
         self.type = type_name
         self.world_x = 0 # Updates when room loads
         self.world_y = 0
+        self.rect = pygame.Rect(0, 0, width, height)
         
         self.image = None
         self.mask = None
+        # Image scaled to the last on-screen size it was drawn at
+        self._scaled_image = None
+        self._scaled_size = None
         
         # Attempt to load asset
         self._load_asset()
         
-    @property
-    def rect(self):
-        return pygame.Rect(self.world_x, self.world_y, self.width, self.height)
+    def set_world_position(self, world_x, world_y):
+        """Place the object in world space and update its cached rect."""
+        self.world_x = world_x
+        self.world_y = world_y
+        self.rect.topleft = (world_x, world_y)
         
     def _load_asset(self):
         """Load specific asset image based on type."""
@@ -294,12 +509,20 @@ class RoomObject:
                 self.image = None
     
     def draw(self, surface, camera):
-        screen_rect = camera.apply_rect(self.rect)
+        # Screen rect as a plain tuple (same maths as Camera.apply_rect)
+        rect = self.rect
+        scale_x, scale_y = camera.scale_x, camera.scale_y
+        screen_x = int((rect.x - camera.x) * scale_x)
+        screen_y = int((rect.y - camera.y) * scale_y)
+        size = (int(rect.width * scale_x), int(rect.height * scale_y))
+        screen_rect = (screen_x, screen_y, size[0], size[1])
         
         if self.image:
-            # Scale image dynamically with camera zoom
-            scaled_img = pygame.transform.scale(self.image, (screen_rect.width, screen_rect.height))
-            surface.blit(scaled_img, screen_rect)
+            # Scale image with camera zoom, only when the zoom changes
+            if self._scaled_size != size:
+                self._scaled_image = pygame.transform.scale(self.image, size)
+                self._scaled_size = size
+            surface.blit(self._scaled_image, (screen_x, screen_y))
         else:
             # Fallback drawing
             if self.type == OBJ_PLATFORM:
@@ -345,8 +568,8 @@ class RoomManager:
         """
         world_path = os.path.join(self.rooms_dir, world_file)
         
-        with open(world_path, 'r') as f:
-            data = json.load(f)
+        with open(world_path, 'rb') as f:
+            data = json_loads(f.read())
         
         start_room_id = data.get('start', 'room_01')
         
@@ -375,6 +598,8 @@ class RoomManager:
                         'facing_right': True
                     }
         
+        self._link_neighbors()
+        
         if start_room_id in self.rooms:
             self.current_room = self.rooms[start_room_id]
             if self.camera:
@@ -385,6 +610,13 @@ class RoomManager:
         for room_id, room in self.rooms.items():
             print(f"{room_id}: bounds={room.bounds}, spawn={room.spawn}")
     
+    def _link_neighbors(self):
+        """Precompute, per room, the other rooms touching its query bounds."""
+        rooms = list(self.rooms.values())
+        for room in rooms:
+            room.neighbors = [other for other in rooms
+                              if other is not room and other.bounds.colliderect(room.query_bounds)]
+    
     def load_chapter(self, chapter_file):
         """Load chapter - just calls load_world."""
         self.load_world(chapter_file)
@@ -399,11 +631,27 @@ class RoomManager:
         
         # Adjacent rooms (for grappling across room boundaries)
         for room in self.rooms.values():
-            if room != self.current_room and room.bounds.inflate(64, 64).colliderect(rect):
+            if room != self.current_room and room.query_bounds.colliderect(rect):
                 collisions.extend(room.get_collisions(rect))
         
         return collisions
     
+    def first_collision(self, rect, tile_types=None):
+        """First tile hit in current or adjacent rooms, or None (see Room.first_collision)."""
+        current = self.current_room
+        if current:
+            tile = current.first_collision(rect, tile_types)
+            if tile is not None:
+                return tile
+        
+        for room in self.rooms.values():
+            if room != current and room.query_bounds.colliderect(rect):
+                tile = room.first_collision(rect, tile_types)
+                if tile is not None:
+                    return tile
+        
+        return None
+    
     def get_solid_collisions(self, rect):
         """Get solid collisions and platform object collisions."""
         collisions = []
@@ -423,7 +671,7 @@ class RoomManager:
         
         # Check adjacent rooms
         for room in self.rooms.values():
-            if room != self.current_room and room.bounds.inflate(64, 64).colliderect(rect):
+            if room != self.current_room and room.query_bounds.colliderect(rect):
                 collisions.extend(room.get_object_collisions(rect))
         
         return collisions
@@ -437,9 +685,14 @@ class RoomManager:
         # Use a slightly expanded rect to catch edge touches
         check_rect = player_rect.inflate(4, 4)
         
-        for room_id, room in self.rooms.items():
-            if room == self.current_room:
-                continue
+        # While the player is near the current room only its neighbors can overlap
+        if self.current_room.query_bounds.contains(check_rect):
+            candidates = self.current_room.neighbors
+        else:
+            candidates = [room for room in self.rooms.values() if room != self.current_room]
+        
+        for room in candidates:
+            room_id = room.room_id
             
             # Use intersection check with expanded rect
             if room.bounds.colliderect(check_rect):
@@ -1,6 +1,7 @@
 import pygame
 import os
 import sys
+import time
 from settings.settings_manager import SettingsManager
 from menus.main_menu import MainMenu
 from menus.pause_menu import PauseMenu
@@ -10,6 +11,29 @@ from game.camera import Camera
 from game.room import RoomManager
 from game.player import Player
 
+# Window events that hide or reveal the game
+WINDOW_HIDE_EVENTS = (pygame.WINDOWMINIMIZED, pygame.WINDOWHIDDEN)
+WINDOW_SHOW_EVENTS = (pygame.WINDOWRESTORED, pygame.WINDOWSHOWN, pygame.WINDOWMAXIMIZED, pygame.WINDOWEXPOSED)
+# Frame rate while nothing is visible; the loop only keeps polling events
+HIDDEN_FPS = 10
+# fps_cap at or above this counts as uncapped ("Unlimited" is stored as 9999)
+UNCAPPED_FPS = 1000
+# Longest uncapped frame handed to the game, so a hitch can't blow up the physics
+MAX_FRAME_DT = 0.05
+
+# Event types read by the game and menus; anything else is dropped each frame
+GAME_EVENT_TYPES = (pygame.QUIT, pygame.KEYDOWN, pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP) + \
+    WINDOW_HIDE_EVENTS + WINDOW_SHOW_EVENTS
+# Minimum time between event polls; above any display refresh rate so
+# uncapped frame rates don't spend their time pumping SDL
+EVENT_POLL_PERIOD = 1 / 120
+
+CONTROL_HINTS = [
+    "WASD: Move | SPACE: Jump | SHIFT: Sprint (ground) / Grapple (aim) | RMB: Grapple",
+    "CTRL/LMB: Roll/Dash (i-frames) | Hold S while grappling: Swing mode",
+    "R: Reset | F3: Debug | ESC: Menu"
+]
+
 
 class Game:
     def __init__(self):
@@ -20,6 +44,7 @@ class Game:
             print("Warning: No audio device found")
         
         self.settings = SettingsManager()
+        self.refresh_controls()
         self._init_display()
         
         pygame.display.set_caption("Grapple")
@@ -40,6 +65,38 @@ class Game:
         self.previous_room_id = None
         
         self.show_debug = True
+        self._last_poll = 0.0
+        self._last_frame = time.perf_counter()
+        # Menu area presented last frame; None after a full flip
+        self._last_dirty_rect = None
+        # False while the window is minimized/hidden; nothing is updated or drawn
+        self._visible = True
+        
+        # Per-frame handler for each state; returns the dirty rect to present,
+        # or None for a full flip
+        self._state_handlers = {
+            "main_menu": self._run_main_menu,
+            "settings": self._run_main_menu,
+            "playing": self._run_playing,
+            "paused": self._run_paused,
+            "editor": self._run_editor,
+            "world_editor": self._run_world_editor,
+        }
+        
+        # HUD/debug fonts, created once rather than every frame
+        self.hud_font = pygame.font.Font(None, 36)
+        self.debug_font = pygame.font.Font(None, 22)
+        self.hint_font = pygame.font.Font(None, 18)
+        # Static text, rendered on first use
+        self._exit_surf = None
+        # (surface, position) pairs for Surface.blits, built on first use
+        self._hint_blits = None
+        # (x, y) -> (text, color, font, surface) for lines from _text_surf
+        self._text_cache = {}
+        
+        # Aim indicator dot, drawn once and blitted along the aim line
+        self._aim_dot = pygame.Surface((5, 5), pygame.SRCALPHA).convert_alpha()
+        pygame.draw.circle(self._aim_dot, (70, 70, 90), (2, 2), 2)
     
     def _init_display(self):
         video = self.settings.get("video")
@@ -57,8 +114,16 @@ class Game:
         self.height = self.screen.get_height()
         self.fps_cap = video["fps_cap"] if video["fps_cap"] != 0 else 9999
     
+    def refresh_controls(self):
+        """Re-read key bindings; called whenever the settings may have changed."""
+        self.controls = self.settings.get("controls")
+        self._pause_key = self.controls["pause"]
+    
     def apply_video_settings(self):
+        self.refresh_controls()
         self._init_display()
+        self._last_dirty_rect = None
+        self._hint_blits = None  # positioned from the bottom of the old screen
         pygame.display.set_caption("Grapple")
         self.main_menu = MainMenu(self)
         self.pause_menu = PauseMenu(self)
@@ -106,7 +171,10 @@ class Game:
         
         # Get spawn from room manager
         spawn = self.room_manager.spawn
-        self.player = Player(spawn[0], spawn[1])
+        if self.player is None:
+            self.player = Player(spawn[0], spawn[1])
+        else:
+            self.player.reset(spawn[0], spawn[1])
         
         # Set initial previous room to "start" for entry point logic
         self.previous_room_id = "start"
@@ -115,98 +183,117 @@ class Game:
     
     def run(self):
         while self.running:
-            dt = self.clock.tick(self.fps_cap) / 1000.0
+            if self._visible and self.fps_cap >= UNCAPPED_FPS:
+                # No frame limiting: tick() only keeps get_fps() current, and
+                # dt comes from perf_counter since tick() has 1ms resolution
+                self.clock.tick()
+                now = time.perf_counter()
+                # The first frame after a stall or a hidden stretch would
+                # otherwise measure all of it
+                dt = min(now - self._last_frame, MAX_FRAME_DT)
+            else:
+                dt = self.clock.tick(self.fps_cap if self._visible else HIDDEN_FPS) / 1000.0
+                now = time.perf_counter()
+            self._last_frame = now
             
-            events = pygame.event.get()
+            if now - self._last_poll >= EVENT_POLL_PERIOD:
+                self._last_poll = now
+                pygame.event.pump()
+                events = pygame.event.get(GAME_EVENT_TYPES, pump=False)
+                # Discard mouse motion/window noise without building Event objects
+                pygame.event.clear(pump=False)
+            else:
+                events = []
+            window_changed = False
             for event in events:
                 if event.type == pygame.QUIT:
                     self.running = False
                 elif event.type == pygame.KEYDOWN:
                     if event.key == pygame.K_F3:
                         self.show_debug = not self.show_debug
+                elif event.type in WINDOW_HIDE_EVENTS or event.type in WINDOW_SHOW_EVENTS:
+                    window_changed = True
             
-            if self.state in ("main_menu", "settings"):
-                self.main_menu.update(events, dt)
-                self.main_menu.draw(self.screen)
-            elif self.state == "playing":
-                self.update_game(events, dt)
-                self.draw_game()
-            elif self.state == "paused":
-                self.pause_menu.update(events, dt)
-                self.draw_game() # Draw game behind pause menu
-                self.pause_menu.draw(self.screen)
-            elif self.state == "editor":
-                # Editor has its own loop structure, but we refactored it to use update/draw
-                # But roomeditor.py handles its own loop in 'run'. 
-                # Since we want to integrate it, we should use its update/draw methods if possible
-                # The refactoring I did kept 'run' but added 'update' and 'draw'. 
-                # However, 'run' has the loop. 
-                # Let's change this: We will just call editor.run() once and let it block?
-                # No, that blocks the main loop here. 
-                # My refactor of RoomEditor added handle_events, update, draw. 
-                # So we can just call those.
-                
-                # We need to manually pass events to editor because it gets them internally in handle_events
-                # But since we already got events here... 
-                # RoomEditor.handle_events calls pygame.event.get() which will be empty if we call it again.
-                # I should have modified RoomEditor to accept events. 
-                # Wait, I didn't modify handle_events to accept events. It calls pygame.event.get().
-                # This is a conflict. 
-                # I should just let the editor RUN its own loop until it exits.
-                
-                if self.editor.running:
-                    self.editor.run()
-                    # When run() returns, it means editor exited
-                    # When run() returns, it means editor exited
-                    if hasattr(self.editor, 'from_world_editor') and self.editor.from_world_editor:
-                        self.editor = None
-                        self.start_world_editor()
-                    else:
-                        self.state = "main_menu"
-                        self.editor = None
-                        # Re-init display if needed or ensure menu is ready
-                        self.main_menu = MainMenu(self)
-                else:
-                    self.state = "main_menu"
-            elif self.state == "world_editor":
-                if self.world_editor.running:
-                    self.world_editor.run() # Assuming WorldEditor also has a run() method that loops
-                    # Wait, WorldEditor has a loop in run(), but if we want it integrated, we should probably
-                    # use update/draw like we tried with RoomEditor but failed due to dependencies.
-                    # Since RoomEditor works by calling .run() (which has its own loop), let's do the same for WorldEditor.
-                    # WorldEditor's run() method should be compatible.
-                    
-                    if self.world_editor.room_to_edit:
-                         # Transition to room editor
-                        room_file = self.world_editor.room_to_edit
-                        self.world_editor = None # Clean up world editor? Or keep it?
-                        # It's better to keep it if we want to preserve state (camera, selection)
-                        # But self.world_editor is currently re-created in start_world_editor?
-                        # start_world_editor re-creates it. 
-                        # To preserve state, we should probably not destroy it, or save state.
-                        # For now, let's just pass the file and when returning, we restart world editor.
-                        # The user asked for "easly menuvering".
-                        
-                        self.start_editor(room_file)
-                        # Mark that we came from world editor so we can go back
-                        self.editor.from_world_editor = True
-                    else:
-                        self.state = "main_menu"
-                        self.world_editor = None
-                        self.main_menu = MainMenu(self)
-                else:
-                    self.state = "main_menu"
+            if window_changed:
+                # The typed get() groups events by type, not arrival order, so
+                # visibility is read from the window itself; and whatever was
+                # covered or hidden needs a full repaint
+                self._visible = pygame.display.get_active()
+                self._last_dirty_rect = None
+            
+            if not self._visible:
+                continue
+            
+            handler = self._state_handlers.get(self.state)
+            dirty_rect = handler(events, dt) if handler else None
             
-            pygame.display.flip()
+            # A menu view that was already fully presented only changes
+            # inside its own area; anything else gets a full flip
+            if dirty_rect is not None and dirty_rect == self._last_dirty_rect:
+                pygame.display.update(dirty_rect)
+            else:
+                pygame.display.flip()
+            self._last_dirty_rect = dirty_rect
         
         pygame.quit()
     
+    def _run_main_menu(self, events, dt):
+        self.main_menu.update(events, dt)
+        self.main_menu.draw(self.screen)
+        return self.main_menu.get_dirty_rect()
+    
+    def _run_playing(self, events, dt):
+        self.update_game(events, dt)
+        self.draw_game()
+    
+    def _run_paused(self, events, dt):
+        self.pause_menu.update(events, dt)
+        # Only the menu area is presented while it is unchanged, so the game
+        # behind it is drawn without the per-frame aim dots and debug text
+        self.draw_game(overlays=False)
+        self.pause_menu.draw(self.screen)
+        return self.pause_menu.get_dirty_rect()
+    
+    def _run_editor(self, events, dt):
+        # The editors read pygame.event.get() themselves, so they run their
+        # own blocking loop and control comes back here once they exit
+        if self.editor.running:
+            self.editor.run()
+            if hasattr(self.editor, 'from_world_editor') and self.editor.from_world_editor:
+                self.editor = None
+                self.start_world_editor()
+            else:
+                self.state = "main_menu"
+                self.editor = None
+                # Re-init display if needed or ensure menu is ready
+                self.main_menu = MainMenu(self)
+        else:
+            self.state = "main_menu"
+    
+    def _run_world_editor(self, events, dt):
+        if self.world_editor.running:
+            self.world_editor.run()
+            
+            if self.world_editor.room_to_edit:
+                # Transition to room editor; the world editor is re-created
+                # when the room editor returns
+                room_file = self.world_editor.room_to_edit
+                self.world_editor = None
+                
+                self.start_editor(room_file)
+                # Mark that we came from world editor so we can go back
+                self.editor.from_world_editor = True
+            else:
+                self.state = "main_menu"
+                self.world_editor = None
+                self.main_menu = MainMenu(self)
+        else:
+            self.state = "main_menu"
+    
     def update_game(self, events, dt):
-        controls = self.settings.get("controls")
-        
         for event in events:
             if event.type == pygame.KEYDOWN:
-                if event.key == controls["pause"] or event.key == pygame.K_ESCAPE:
+                if event.key == self._pause_key or event.key == pygame.K_ESCAPE:
                     self.state = "paused"
                     self.pause_menu = PauseMenu(self) # Reset pause menu state
                     return
@@ -221,7 +308,7 @@ class Game:
             return
         
         # Update player
-        self.player.update(dt, self.room_manager, controls, self.camera)
+        self.player.update(dt, self.room_manager, self.controls, self.camera)
         
         # Check for exit
         if self.player.on_exit and not self.camera.transitioning:
@@ -273,20 +360,26 @@ class Game:
         """Respawn player using room manager logic."""
         self.room_manager.respawn_player(self.player)
     
-    def draw_game(self):
+    def draw_game(self, overlays=True):
         self.screen.fill((15, 15, 25))
         self.room_manager.draw(self.screen, self.camera)
         
-        self.player.draw(self.screen, self.camera)
+        # Player and grapple are pygame.draw primitives only, so one lock covers
+        # them all (blits refuse a locked surface, so the HUD stays outside)
+        self.screen.lock()
+        try:
+            self.player.draw(self.screen, self.camera)
+        finally:
+            self.screen.unlock()
         
         # Aim indicator
-        if self.player.grapple.state == "inactive":
+        if overlays and self.player.grapple.state == "inactive":
             self._draw_aim_indicator()
         
         # Draw HUD
         self._draw_hud()
         
-        if self.show_debug:
+        if overlays and self.show_debug:
             self._draw_debug()
         
         self._draw_controls()
@@ -295,36 +388,43 @@ class Game:
         """Draw UI."""
         # Exit indicator (if you have exit tiles)
         if hasattr(self.player, 'on_exit') and self.player.on_exit:
-            exit_font = pygame.font.Font(None, 36)
-            exit_text = exit_font.render("EXIT - Press E to continue", True, (100, 255, 100))
-            text_rect = exit_text.get_rect(center=(self.width // 2, 50))
-            self.screen.blit(exit_text, text_rect)
+            if self._exit_surf is None:
+                self._exit_surf = self.hud_font.render("EXIT - Press E to continue", True, (100, 255, 100)).convert_alpha()
+            text_rect = self._exit_surf.get_rect(center=(self.width // 2, 50))
+            self.screen.blit(self._exit_surf, text_rect)
     
     def _draw_aim_indicator(self):
         """Draw subtle aim dots."""
-        mouse_pos = pygame.mouse.get_pos()
-        player_screen = self.camera.apply(self.player.center)
-        
-        dx = mouse_pos[0] - player_screen[0]
-        dy = mouse_pos[1] - player_screen[1]
-        dist = (dx * dx + dy * dy) ** 0.5
-        
-        if dist > 30:
+        mx, my = pygame.mouse.get_pos()
+        # Player centre on screen (Camera.world_to_screen inlined)
+        camera = self.camera
+        player = self.player
+        px = (player.x + player.width / 2 - camera.x) * camera.scale_x
+        py = (player.y + player.height / 2 - camera.y) * camera.scale_y
+        
+        dx = mx - px
+        dy = my - py
+        dist_sq = dx * dx + dy * dy
+        
+        # Compare squared so no sqrt is taken while the cursor is on the player
+        if dist_sq > 900:
+            dist = dist_sq ** 0.5
             dx /= dist
             dy /= dist
+            dot = self._aim_dot
+            blit = self.screen.blit
             for i in range(0, min(int(dist), 120), 20):
-                x = player_screen[0] + dx * i
-                y = player_screen[1] + dy * i
-                pygame.draw.circle(self.screen, (70, 70, 90), (int(x), int(y)), 2)
+                blit(dot, (int(px + dx * i) - 2, int(py + dy * i) - 2))
     
     def _draw_debug(self):
-        font = pygame.font.Font(None, 22)
+        font = self.debug_font
+        lines = []
         y = 8
         
         # FPS
         fps = int(self.clock.get_fps())
         color = (100, 255, 100) if fps >= 55 else (255, 200, 100) if fps >= 30 else (255, 100, 100)
-        self._text(font, f"FPS: {fps}", 8, y, color)
+        lines.append(self._text_surf(font, f"FPS: {fps}", 8, y, color))
         y += 16
         
         # State
@@ -344,28 +444,33 @@ class Game:
         if self.player.grapple.state != "inactive":
             states.append(f"GRAPPLE:{self.player.grapple.state}")
         
-        self._text(font, " | ".join(states), 8, y, (150, 150, 150))
+        lines.append(self._text_surf(font, " | ".join(states), 8, y, (150, 150, 150)))
         y += 16
         
         # Velocity
-        speed = int((self.player.vx ** 2 + self.player.vy ** 2) ** 0.5)
-        self._text(font, f"Vel: ({int(self.player.vx)}, {int(self.player.vy)}) = {speed}", 8, y, (120, 120, 120))
+        vx, vy = self.player.vx, self.player.vy
+        speed = int((vx * vx + vy * vy) ** 0.5)
+        lines.append(self._text_surf(font, f"Vel: ({int(vx)}, {int(vy)}) = {speed}", 8, y, (120, 120, 120)))
+        
+        self.screen.blits(lines, doreturn=False)
     
     def _draw_controls(self):
-        font = pygame.font.Font(None, 18)
-        hints = [
-            "WASD: Move | SPACE: Jump | SHIFT: Sprint (ground) / Grapple (aim) | RMB: Grapple",
-            "CTRL/LMB: Roll/Dash (i-frames) | Hold S while grappling: Swing mode",
-            "R: Reset | F3: Debug | ESC: Menu"
-        ]
-        y = self.height - 46
-        for hint in hints:
-            self._text(font, hint, 8, y, (60, 60, 80))
-            y += 14
+        if self._hint_blits is None:
+            y = self.height - 46
+            self._hint_blits = [
+                (self.hint_font.render(hint, True, (60, 60, 80)).convert_alpha(), (8, y + i * 14))
+                for i, hint in enumerate(CONTROL_HINTS)
+            ]
+        self.screen.blits(self._hint_blits, doreturn=False)
     
-    def _text(self, font, text, x, y, color):
-        surf = font.render(text, True, color)
-        self.screen.blit(surf, (x, y))
+    def _text_surf(self, font, text, x, y, color):
+        """(surface, position) for a text line, ready for Surface.blits."""
+        # Each screen position keeps its last render until the text changes
+        cached = self._text_cache.get((x, y))
+        if cached is None or cached[0] != text or cached[1] != color or cached[2] is not font:
+            cached = (text, color, font, font.render(text, True, color).convert_alpha())
+            self._text_cache[(x, y)] = cached
+        return cached[3], (x, y)
 
 
 if __name__ == "__main__":
@@ -1,5 +1,5 @@
 import pygame
-from .ui_components import Button
+from .ui_components import Button, get_font, prepare_events
 from .settings_menu import SettingsMenu
 from constants import *
 
@@ -23,40 +23,68 @@ class MainMenu:
             Button(w//2 - btn_w//2, h//2 + 200, btn_w, btn_h, "Quit"),
         ]
         self.buttons[self.selected_index].selected = True
+        # Mouse position the buttons were last updated with (None: not yet)
+        self._last_mouse = None
+        # Called when the button with the same index is activated
+        self._actions = [
+            self.game.start_game,
+            self.game.start_editor,
+            self.game.start_world_editor,
+            self._open_settings,
+            self._quit,
+        ]
+        
+        self.title_surf = get_font(64).render("GRAPPLE", True, COLOR_WHITE).convert_alpha()
+        self.subtitle_surf = get_font(24).render("A grappling hook action game", True, COLOR_ACCENT).convert_alpha()
+        
+        # Everything this menu draws besides the plain background
+        title_rect = self.title_surf.get_rect(midtop=(w//2, h//4))
+        subtitle_rect = self.subtitle_surf.get_rect(midtop=(w//2, h//4 + 50))
+        self.dirty_rect = title_rect.unionall([subtitle_rect] + [btn.rect for btn in self.buttons])
+    
+    def get_dirty_rect(self):
+        """Screen area that can change between frames while this view is shown."""
+        if self.in_settings:
+            return self.settings_menu.dirty_rect
+        return self.dirty_rect
     
     def update(self, events, dt):
         if self.in_settings:
             if self.settings_menu.update(events, dt) == "back":
                 self.in_settings = False
+                self.game.refresh_controls()
                 self._create_buttons()
             return
         
         mouse_pos = pygame.mouse.get_pos()
+        prepared = prepare_events(events)
         
-        for event in events:
-            if event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_UP:
-                    self.buttons[self.selected_index].selected = False
-                    self.selected_index = (self.selected_index - 1) % len(self.buttons)
-                    self.buttons[self.selected_index].selected = True
-                elif event.key == pygame.K_DOWN:
-                    self.buttons[self.selected_index].selected = False
-                    self.selected_index = (self.selected_index + 1) % len(self.buttons)
-                    self.buttons[self.selected_index].selected = True
+        for event in prepared.keydown:
+            if event.key == pygame.K_UP:
+                self.buttons[self.selected_index].selected = False
+                self.selected_index = (self.selected_index - 1) % len(self.buttons)
+                self.buttons[self.selected_index].selected = True
+            elif event.key == pygame.K_DOWN:
+                self.buttons[self.selected_index].selected = False
+                self.selected_index = (self.selected_index + 1) % len(self.buttons)
+                self.buttons[self.selected_index].selected = True
         
-        for i, btn in enumerate(self.buttons):
-            if btn.update(mouse_pos, events):
-                if i == 0:
-                    self.game.start_game()
-                elif i == 1:
-                    self.game.start_editor()
-                elif i == 2:
-                    self.game.start_world_editor()
-                elif i == 3:
-                    self.in_settings = True
-                    self.settings_menu = SettingsMenu(self.game)
-                elif i == 4:
-                    self.game.running = False
+        # Buttons only change on mouse movement, clicks or keys
+        if mouse_pos == self._last_mouse and not prepared.mousedown and not prepared.keydown:
+            return
+        self._last_mouse = mouse_pos
+        
+        for btn, action in zip(self.buttons, self._actions):
+            if btn.update(mouse_pos, prepared):
+                action()
+                break
+    
+    def _open_settings(self):
+        self.in_settings = True
+        self.settings_menu = SettingsMenu(self.game)
+    
+    def _quit(self):
+        self.game.running = False
     
     def draw(self, surface):
         surface.fill(COLOR_BG)
@@ -67,13 +95,10 @@ class MainMenu:
         
         w, h = surface.get_size()
         
-        font_big = pygame.font.Font(None, 64)
-        font_small = pygame.font.Font(None, 24)
-        
-        title = font_big.render("GRAPPLE", True, COLOR_WHITE)
+        title = self.title_surf
         surface.blit(title, (w//2 - title.get_width()//2, h//4))
         
-        subtitle = font_small.render("A grappling hook action game", True, COLOR_ACCENT)
+        subtitle = self.subtitle_surf
         surface.blit(subtitle, (w//2 - subtitle.get_width()//2, h//4 + 50))
         
         for btn in self.buttons:
@@ -1,5 +1,5 @@
 import pygame
-from .ui_components import Button
+from .ui_components import Button, get_font, prepare_events
 from .settings_menu import SettingsMenu
 from constants import *
 
@@ -19,40 +19,67 @@ class PauseMenu:
             Button(w//2 - btn_w//2, h//2, btn_w, btn_h, "Settings"),
             Button(w//2 - btn_w//2, h//2 + 60, btn_w, btn_h, "Main Menu"),
         ]
+        # Mouse position the buttons were last updated with (None: not yet)
+        self._last_mouse = None
+        # Called when the button with the same index is activated
+        self._actions = [self._resume, self._open_settings, self._to_main_menu]
+        
+        self.title_surf = get_font(64).render("PAUSED", True, COLOR_WHITE).convert_alpha()
+        title_rect = self.title_surf.get_rect(midtop=(w//2, 100))
+        self.dirty_rect = title_rect.unionall([btn.rect for btn in self.buttons])
+        
+        # Semi-transparent overlay over the game, sized to the screen
+        self.dim_surf = pygame.Surface((w, h), pygame.SRCALPHA).convert_alpha()
+        self.dim_surf.fill((0, 0, 0, 150))
+    
+    def get_dirty_rect(self):
+        """Screen area that can change between frames while this view is shown."""
+        if self.in_settings:
+            return self.settings_menu.dirty_rect
+        return self.dirty_rect
     
     def update(self, events, dt):
         if self.in_settings:
             if self.settings_menu.update(events, dt) == "back":
                 self.in_settings = False
+                self.game.refresh_controls()
                 self._create_buttons() # Recreate buttons to ensure they have correct references if needed
             return
         
         mouse_pos = pygame.mouse.get_pos()
+        prepared = prepare_events(events)
         
-        for i, btn in enumerate(self.buttons):
-            if btn.update(mouse_pos, events):
-                if i == 0: # Resume
-                    self.game.state = "playing"
-                elif i == 1: # Settings
-                    self.in_settings = True
-                    self.settings_menu = SettingsMenu(self.game)
-                elif i == 2: # Main Menu
-                    self.game.state = "main_menu"
-                    self.game.main_menu = self.game.create_main_menu() # Recreate main menu to reset state
+        # Buttons only change on mouse movement, clicks or keys
+        if mouse_pos == self._last_mouse and not prepared.mousedown and not prepared.keydown:
+            return
+        self._last_mouse = mouse_pos
+        
+        for btn, action in zip(self.buttons, self._actions):
+            if btn.update(mouse_pos, prepared):
+                action()
+                break
+    
+    def _resume(self):
+        self.game.state = "playing"
+    
+    def _open_settings(self):
+        self.in_settings = True
+        self.settings_menu = SettingsMenu(self.game)
+    
+    def _to_main_menu(self):
+        self.game.state = "main_menu"
+        self.game.main_menu = self.game.create_main_menu() # Recreate main menu to reset state
     
     def draw(self, surface):
         # Draw semi-transparent background
-        dim = pygame.Surface(surface.get_size(), pygame.SRCALPHA)
-        dim.fill((0, 0, 0, 150))
-        surface.blit(dim, (0, 0))
+        surface.blit(self.dim_surf, (0, 0))
         
         if self.in_settings:
             self.settings_menu.draw(surface)
             return
         
         # Draw "PAUSED" text
-        font = pygame.font.Font(None, 64)
-        text = font.render("PAUSED", True, COLOR_WHITE)
+        text = self.title_surf
         surface.blit(text, (surface.get_width()//2 - text.get_width()//2, 100))
         
         for btn in self.buttons:
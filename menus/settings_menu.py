@@ -1,8 +1,11 @@
 import pygame
-from .ui_components import Button, Slider, Selector, Toggle, KeyBinder
+from .ui_components import Button, Slider, Selector, Toggle, KeyBinder, get_font, prepare_events
 from settings.settings_manager import get_resolution_options, FPS_OPTIONS
 from constants import *
 
+# Settings keys of the audio sliders, in display order
+AUDIO_KEYS = ("master", "sfx", "music")
+
 class SettingsMenu:
     def __init__(self, game):
         self.game = game
@@ -57,12 +60,26 @@ class SettingsMenu:
         self.back_button = Button(30, h - 50, 80, 35, "Back", 20)
         self.apply_button = Button(w - 110, h - 50, 80, 35, "Apply", 20)
         
+        self.title_surf = get_font(32).render("Settings", True, COLOR_WHITE).convert_alpha()
+        title_rect = self.title_surf.get_rect(midtop=(w//2, 20))
+        self.title_pos = title_rect.topleft
+        
+        # Union of everything drawn, with the 22px label row above each element
+        rects = [title_rect, self.back_button.rect, self.apply_button.rect]
+        rects += [btn.rect for btn in self.tab_buttons]
+        for e in self.video_elements + self.audio_elements + self.control_elements:
+            rects.append(e.rect.inflate(0, 22).move(0, -11))
+        self.dirty_rect = rects[0].unionall(rects[1:])
+        
         self._update_selection()
     
     def _get_elements(self):
         return [self.video_elements, self.audio_elements, self.control_elements][self.current_tab]
     
     def _update_selection(self):
+        # Runs on every tab change, so draw doesn't have to re-mark the tab buttons
+        for i, btn in enumerate(self.tab_buttons):
+            btn.selected = (i == self.current_tab)
         for e in self.video_elements + self.audio_elements + self.control_elements:
             e.selected = False
         elements = self._get_elements()
@@ -71,51 +88,62 @@ class SettingsMenu:
     
     def update(self, events, dt):
         mouse_pos = pygame.mouse.get_pos()
+        prepared = prepare_events(events)
         elements = self._get_elements()
         
-        waiting = self.current_tab == 2 and any(e.waiting_for_input for e in self.control_elements)
-        
-        for event in events:
-            if event.type == pygame.KEYDOWN and not waiting:
-                if event.key == pygame.K_ESCAPE:
-                    return "back"
-                elif event.key == pygame.K_UP:
-                    self.selected_index = (self.selected_index - 1) % len(elements)
-                    self._update_selection()
-                elif event.key == pygame.K_DOWN:
-                    self.selected_index = (self.selected_index + 1) % len(elements)
-                    self._update_selection()
-                elif event.key == pygame.K_TAB:
-                    self.current_tab = (self.current_tab + 1) % 3
-                    self.selected_index = 0
-                    self._update_selection()
+        if self.current_tab == 2:
+            binder = next((e for e in self.control_elements if e.waiting_for_input), None)
+            if binder is not None:
+                # While rebinding, the pressed key belongs to that binder alone
+                if binder.update(mouse_pos, prepared):
+                    self.settings.set("controls", binder.action, binder.key, flush=False)
+                return None
+        
+        for event in prepared.keydown:
+            if event.key == pygame.K_ESCAPE:
+                self.settings.flush()
+                return "back"
+            elif event.key == pygame.K_UP:
+                self.selected_index = (self.selected_index - 1) % len(elements)
+                self._update_selection()
+            elif event.key == pygame.K_DOWN:
+                self.selected_index = (self.selected_index + 1) % len(elements)
+                self._update_selection()
+            elif event.key == pygame.K_TAB:
+                self.current_tab = (self.current_tab + 1) % 3
+                self.selected_index = 0
+                self._update_selection()
         
         for i, btn in enumerate(self.tab_buttons):
-            if btn.update(mouse_pos, events):
+            if btn.update(mouse_pos, prepared):
                 self.current_tab = i
                 self.selected_index = 0
                 self._update_selection()
         
-        for elem in elements:
-            if elem.update(mouse_pos, events):
+        for i, elem in enumerate(elements):
+            if elem.update(mouse_pos, prepared):
+                # Only the widget that changed is written back
                 if self.current_tab == 1:
-                    self.settings.set("audio", "master", self.audio_elements[0].value)
-                    self.settings.set("audio", "sfx", self.audio_elements[1].value)
-                    self.settings.set("audio", "music", self.audio_elements[2].value)
+                    self.settings.set("audio", AUDIO_KEYS[i], elem.value, flush=False)
                 elif self.current_tab == 2:
-                    for c in self.control_elements:
-                        self.settings.set("controls", c.action, c.key)
+                    self.settings.set("controls", elem.action, elem.key, flush=False)
+        
+        # Slider drags write to disk once, when released
+        if not any(s.dragging for s in self.audio_elements):
+            self.settings.flush()
         
-        if self.back_button.update(mouse_pos, events):
+        if self.back_button.update(mouse_pos, prepared):
+            self.settings.flush()
             return "back"
         
-        if self.apply_button.update(mouse_pos, events) and self.current_tab == 0:
+        if self.apply_button.update(mouse_pos, prepared) and self.current_tab == 0:
             res = self.video_elements[0].get_value()
             fps = self.video_elements[1].get_value()
-            self.settings.set("video", "resolution", list(res))
-            self.settings.set("video", "fps_cap", fps)
-            self.settings.set("video", "fullscreen", self.video_elements[2].value)
-            self.settings.set("video", "vsync", self.video_elements[3].value)
+            self.settings.set("video", "resolution", list(res), flush=False)
+            self.settings.set("video", "fps_cap", fps, flush=False)
+            self.settings.set("video", "fullscreen", self.video_elements[2].value, flush=False)
+            self.settings.set("video", "vsync", self.video_elements[3].value, flush=False)
+            self.settings.flush()
             self.game.apply_video_settings()
             self._create_ui()
         
@@ -123,14 +151,9 @@ class SettingsMenu:
     
     def draw(self, surface):
         surface.fill(COLOR_BG)
-        w = surface.get_width()
+        surface.blit(self.title_surf, self.title_pos)
         
-        font = pygame.font.Font(None, 32)
-        title = font.render("Settings", True, COLOR_WHITE)
-        surface.blit(title, (w//2 - title.get_width()//2, 20))
-        
-        for i, btn in enumerate(self.tab_buttons):
-            btn.selected = (i == self.current_tab)
+        for btn in self.tab_buttons:
             btn.draw(surface)
         
         for elem in self._get_elements():
@@ -1,24 +1,95 @@
 import pygame
 from constants import *
+from settings.settings_manager import key_name
+
+# Max rendered strings kept per widget before its cache is reset
+TEXT_CACHE_SIZE = 16
+
+# Default font, one instance per size shared by every widget
+_FONT_CACHE = {}
+
+
+def get_font(size):
+    """Shared default-font instance for the given size."""
+    font = _FONT_CACHE.get(size)
+    if font is None:
+        font = _FONT_CACHE[size] = pygame.font.Font(None, size)
+    return font
+
+
+def _render_text(widget, text, color):
+    """Render text with the widget's font, reusing surfaces from earlier frames."""
+    cache = widget._text_cache
+    key = (text, color)
+    surf = cache.get(key)
+    if surf is None:
+        if len(cache) >= TEXT_CACHE_SIZE:
+            cache.clear()
+        surf = widget.font.render(text, True, color).convert_alpha()
+        cache[key] = surf
+    return surf
+
+
+def _bake_frame(widget):
+    """Draw a widget's label, fill and border once; returns the surface and the
+    widget's rect in its local coordinates."""
+    rect = widget.rect
+    label_surf = _render_text(widget, widget.label, COLOR_WHITE)
+    bg = pygame.Surface((max(rect.width, label_surf.get_width()), rect.height + 22), pygame.SRCALPHA).convert_alpha()
+    bg.blit(label_surf, (0, 0))
+    
+    local_rect = pygame.Rect(0, 22, rect.width, rect.height)
+    pygame.draw.rect(bg, COLOR_DARK_GRAY, local_rect)
+    pygame.draw.rect(bg, COLOR_LIGHT_GRAY, local_rect, 1)
+    return bg, local_rect
+
+
+class PreparedEvents:
+    """A frame's events split by type once, so widgets only scan what they use."""
+    __slots__ = ('mousedown', 'mouseup', 'keydown')
+    
+    def __init__(self, mousedown, mouseup, keydown):
+        self.mousedown = mousedown
+        self.mouseup = mouseup
+        self.keydown = keydown
+
+
+def prepare_events(events):
+    """Bucket a frame's events into mouse-down, mouse-up and key-down lists."""
+    mousedown = []
+    mouseup = []
+    keydown = []
+    for event in events:
+        event_type = event.type
+        if event_type == pygame.MOUSEBUTTONDOWN:
+            mousedown.append(event)
+        elif event_type == pygame.MOUSEBUTTONUP:
+            mouseup.append(event)
+        elif event_type == pygame.KEYDOWN:
+            keydown.append(event)
+    return PreparedEvents(mousedown, mouseup, keydown)
+
 
 class Button:
     def __init__(self, x, y, width, height, text, font_size=24):
         self.rect = pygame.Rect(x, y, width, height)
         self.text = text
-        self.font = pygame.font.Font(None, font_size)
+        self.font = get_font(font_size)
+        self._text_cache = {}
         self.hovered = False
         self.selected = False
         self.enabled = True
     
-    def update(self, mouse_pos, events):
-        self.hovered = self.rect.collidepoint(mouse_pos) and self.enabled
+    def update(self, mouse_pos, prepared):
+        self.hovered = self.enabled and self.rect.collidepoint(mouse_pos)
         
-        for event in events:
-            if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
-                if self.hovered:
+        if self.hovered:
+            for event in prepared.mousedown:
+                if event.button == 1:
                     return True
-            if event.type == pygame.KEYDOWN and event.key == pygame.K_RETURN:
-                if self.selected:
+        if self.selected:
+            for event in prepared.keydown:
+                if event.key == pygame.K_RETURN:
                     return True
         return False
     
@@ -34,7 +105,7 @@ class Button:
         pygame.draw.rect(surface, border_color, self.rect, 2)
         
         text_color = COLOR_WHITE if self.enabled else COLOR_GRAY
-        text_surf = self.font.render(self.text, True, text_color)
+        text_surf = _render_text(self, self.text, text_color)
         text_rect = text_surf.get_rect(center=self.rect.center)
         surface.blit(text_surf, text_rect)
 
@@ -46,22 +117,26 @@ class Slider:
         self.max_val = max_val
         self.value = value
         self.label = label
-        self.font = pygame.font.Font(None, font_size)
+        self.font = get_font(font_size)
+        self._text_cache = {}
+        self._bg_surf = None
         self.dragging = False
         self.hovered = False
         self.selected = False
     
-    def update(self, mouse_pos, events):
+    def update(self, mouse_pos, prepared):
         self.hovered = self.rect.collidepoint(mouse_pos)
         
-        for event in events:
-            if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
-                if self.hovered:
+        if self.hovered:
+            for event in prepared.mousedown:
+                if event.button == 1:
                     self.dragging = True
-            if event.type == pygame.MOUSEBUTTONUP and event.button == 1:
+        for event in prepared.mouseup:
+            if event.button == 1:
                 self.dragging = False
-            if event.type == pygame.KEYDOWN and self.selected:
-                step = (self.max_val - self.min_val) / 20
+        if self.selected:
+            step = (self.max_val - self.min_val) / 20
+            for event in prepared.keydown:
                 if event.key == pygame.K_LEFT:
                     self.value = max(self.min_val, self.value - step)
                     return True
@@ -77,18 +152,16 @@ class Slider:
         return False
     
     def draw(self, surface):
-        label_surf = self.font.render(self.label, True, COLOR_WHITE)
-        surface.blit(label_surf, (self.rect.x, self.rect.y - 22))
-        
-        pygame.draw.rect(surface, COLOR_DARK_GRAY, self.rect)
-        pygame.draw.rect(surface, COLOR_LIGHT_GRAY, self.rect, 1)
+        if self._bg_surf is None:
+            self._bg_surf = _bake_frame(self)[0]
+        surface.blit(self._bg_surf, (self.rect.x, self.rect.y - 22))
         
         fill_width = int((self.value - self.min_val) / (self.max_val - self.min_val) * self.rect.width)
         fill_rect = pygame.Rect(self.rect.x, self.rect.y, fill_width, self.rect.height)
         pygame.draw.rect(surface, COLOR_ACCENT, fill_rect)
         
         val_text = f"{int(self.value * 100)}%" if self.max_val <= 1 else str(int(self.value))
-        val_surf = self.font.render(val_text, True, COLOR_WHITE)
+        val_surf = _render_text(self, val_text, COLOR_WHITE)
         surface.blit(val_surf, (self.rect.right - val_surf.get_width() - 5, self.rect.centery - val_surf.get_height()//2))
 
 
@@ -98,26 +171,28 @@ class Selector:
         self.options = options
         self.index = current_index
         self.label = label
-        self.font = pygame.font.Font(None, font_size)
+        self.font = get_font(font_size)
+        self._text_cache = {}
+        self._bg_surf = None
         self.hovered = False
         self.selected = False
         self.left_arrow = pygame.Rect(x, y, 30, height)
         self.right_arrow = pygame.Rect(x + width - 30, y, 30, height)
     
-    def update(self, mouse_pos, events):
+    def update(self, mouse_pos, prepared):
         self.hovered = self.rect.collidepoint(mouse_pos)
-        left_hover = self.left_arrow.collidepoint(mouse_pos)
-        right_hover = self.right_arrow.collidepoint(mouse_pos)
+        # The arrows lie inside the widget, so they only need testing on hover
+        left_hover = self.hovered and self.left_arrow.collidepoint(mouse_pos)
+        right_hover = self.hovered and self.right_arrow.collidepoint(mouse_pos)
         
-        for event in events:
-            if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
-                if left_hover:
-                    self.index = (self.index - 1) % len(self.options)
+        if left_hover or right_hover:
+            for event in prepared.mousedown:
+                if event.button == 1:
+                    step = -1 if left_hover else 1
+                    self.index = (self.index + step) % len(self.options)
                     return True
-                elif right_hover:
-                    self.index = (self.index + 1) % len(self.options)
-                    return True
-            if event.type == pygame.KEYDOWN and self.selected:
+        if self.selected:
+            for event in prepared.keydown:
                 if event.key == pygame.K_LEFT:
                     self.index = (self.index - 1) % len(self.options)
                     return True
@@ -129,28 +204,32 @@ class Selector:
     def get_value(self):
         return self.options[self.index]
     
-    def draw(self, surface):
-        label_surf = self.font.render(self.label, True, COLOR_WHITE)
-        surface.blit(label_surf, (self.rect.x, self.rect.y - 22))
-        
-        pygame.draw.rect(surface, COLOR_DARK_GRAY, self.rect)
-        pygame.draw.rect(surface, COLOR_LIGHT_GRAY, self.rect, 1)
+    def _build_background(self):
+        bg, local_rect = _bake_frame(self)
         
         # Arrows
-        pygame.draw.polygon(surface, COLOR_WHITE, [
-            (self.left_arrow.centerx + 5, self.left_arrow.centery - 8),
-            (self.left_arrow.centerx - 5, self.left_arrow.centery),
-            (self.left_arrow.centerx + 5, self.left_arrow.centery + 8)
+        left = pygame.Rect(0, local_rect.y, 30, local_rect.height)
+        right = pygame.Rect(local_rect.width - 30, local_rect.y, 30, local_rect.height)
+        pygame.draw.polygon(bg, COLOR_WHITE, [
+            (left.centerx + 5, left.centery - 8),
+            (left.centerx - 5, left.centery),
+            (left.centerx + 5, left.centery + 8)
         ])
-        pygame.draw.polygon(surface, COLOR_WHITE, [
-            (self.right_arrow.centerx - 5, self.right_arrow.centery - 8),
-            (self.right_arrow.centerx + 5, self.right_arrow.centery),
-            (self.right_arrow.centerx - 5, self.right_arrow.centery + 8)
+        pygame.draw.polygon(bg, COLOR_WHITE, [
+            (right.centerx - 5, right.centery - 8),
+            (right.centerx + 5, right.centery),
+            (right.centerx - 5, right.centery + 8)
         ])
+        return bg
+    
+    def draw(self, surface):
+        if self._bg_surf is None:
+            self._bg_surf = self._build_background()
+        surface.blit(self._bg_surf, (self.rect.x, self.rect.y - 22))
         
         value = self.options[self.index]
         val_text = f"{value[0]}x{value[1]}" if isinstance(value, tuple) else ("Unlimited" if value == 0 else str(value))
-        val_surf = self.font.render(val_text, True, COLOR_WHITE)
+        val_surf = _render_text(self, val_text, COLOR_WHITE)
         surface.blit(val_surf, (self.rect.centerx - val_surf.get_width()//2, self.rect.centery - val_surf.get_height()//2))
 
 
@@ -159,27 +238,30 @@ class Toggle:
         self.rect = pygame.Rect(x, y, width, height)
         self.value = value
         self.label = label
-        self.font = pygame.font.Font(None, font_size)
+        self.font = get_font(font_size)
+        self._text_cache = {}
+        self._bg_surf = None
         self.hovered = False
         self.selected = False
     
-    def update(self, mouse_pos, events):
+    def update(self, mouse_pos, prepared):
         self.hovered = self.rect.collidepoint(mouse_pos)
-        for event in events:
-            if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1 and self.hovered:
-                self.value = not self.value
-                return True
-            if event.type == pygame.KEYDOWN and self.selected and event.key in (pygame.K_RETURN, pygame.K_SPACE):
-                self.value = not self.value
-                return True
+        if self.hovered:
+            for event in prepared.mousedown:
+                if event.button == 1:
+                    self.value = not self.value
+                    return True
+        if self.selected:
+            for event in prepared.keydown:
+                if event.key in (pygame.K_RETURN, pygame.K_SPACE):
+                    self.value = not self.value
+                    return True
         return False
     
     def draw(self, surface):
-        label_surf = self.font.render(self.label, True, COLOR_WHITE)
-        surface.blit(label_surf, (self.rect.x, self.rect.y - 22))
-        
-        pygame.draw.rect(surface, COLOR_DARK_GRAY, self.rect)
-        pygame.draw.rect(surface, COLOR_LIGHT_GRAY, self.rect, 1)
+        if self._bg_surf is None:
+            self._bg_surf = _bake_frame(self)[0]
+        surface.blit(self._bg_surf, (self.rect.x, self.rect.y - 22))
         
         indicator = pygame.Rect(0, 0, 30, self.rect.height - 6)
         indicator.centery = self.rect.centery
@@ -191,7 +273,7 @@ class Toggle:
             pygame.draw.rect(surface, COLOR_LIGHT_GRAY, indicator)
         
         text = "ON" if self.value else "OFF"
-        text_surf = self.font.render(text, True, COLOR_WHITE)
+        text_surf = _render_text(self, text, COLOR_WHITE)
         surface.blit(text_surf, (self.rect.centerx - text_surf.get_width()//2, self.rect.centery - text_surf.get_height()//2))
 
 
@@ -201,35 +283,40 @@ class KeyBinder:
         self.action = action
         self.key = current_key
         self.label = label
-        self.font = pygame.font.Font(None, font_size)
+        self.font = get_font(font_size)
+        self._text_cache = {}
         self.waiting_for_input = False
         self.hovered = False
         self.selected = False
     
-    def update(self, mouse_pos, events):
+    def update(self, mouse_pos, prepared):
         self.hovered = self.rect.collidepoint(mouse_pos)
-        for event in events:
-            if self.waiting_for_input:
-                if event.type == pygame.KEYDOWN:
-                    if event.key != pygame.K_ESCAPE:
-                        self.key = event.key
-                    self.waiting_for_input = False
-                    return True
-            else:
-                if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1 and self.hovered:
+        if self.waiting_for_input:
+            for event in prepared.keydown:
+                if event.key != pygame.K_ESCAPE:
+                    self.key = event.key
+                self.waiting_for_input = False
+                return True
+            return False
+        
+        if self.hovered:
+            for event in prepared.mousedown:
+                if event.button == 1:
                     self.waiting_for_input = True
-                if event.type == pygame.KEYDOWN and self.selected and event.key == pygame.K_RETURN:
+        if self.selected:
+            for event in prepared.keydown:
+                if event.key == pygame.K_RETURN:
                     self.waiting_for_input = True
         return False
     
     def draw(self, surface):
-        label_surf = self.font.render(self.label, True, COLOR_WHITE)
+        label_surf = _render_text(self, self.label, COLOR_WHITE)
         surface.blit(label_surf, (self.rect.x, self.rect.y - 22))
         
         bg_color = COLOR_ACCENT if self.waiting_for_input else (COLOR_GRAY if self.hovered or self.selected else COLOR_DARK_GRAY)
         pygame.draw.rect(surface, bg_color, self.rect)
         pygame.draw.rect(surface, COLOR_LIGHT_GRAY, self.rect, 1)
         
-        text = "Press key..." if self.waiting_for_input else pygame.key.name(self.key).upper()
-        text_surf = self.font.render(text, True, COLOR_WHITE)
+        text = "Press key..." if self.waiting_for_input else key_name(self.key)
+        text_surf = _render_text(self, text, COLOR_WHITE)
         surface.blit(text_surf, (self.rect.centerx - text_surf.get_width()//2, self.rect.centery - text_surf.get_height()//2))
\ No newline at end of file
@@ -8,6 +8,16 @@ import pygame
 import json
 import os
 import sys
+from bisect import bisect_right
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+# orjson is optional; without it rooms are written as compact stdlib JSON
+try:
+    from orjson import dumps as json_dumps
+except ImportError:
+    def json_dumps(obj):
+        return json.dumps(obj, separators=(",", ":")).encode()
 
 # ============================================================================
 # CONSTANTS
@@ -49,6 +59,9 @@ TILE_COLORS = {
     TILE_ICE: (100, 200, 255),
 }
 
+# TILE_COLORS indexed by tile byte, magenta for unknown types
+TILE_COLOR_BY_TYPE = tuple(TILE_COLORS.get(t, (255, 0, 255)) for t in range(256))
+
 SUBGRID_SIZE = 16
 
 # UI Colors
@@ -71,18 +84,61 @@ COLOR_SPAWN = (255, 220, 50)
 TOOLBAR_HEIGHT = 40
 SIDEBAR_WIDTH = 240
 
+# Event types the editor never handles; SDL is told not to queue them while it runs
+IGNORED_EVENTS = (
+    pygame.JOYAXISMOTION, pygame.JOYBALLMOTION, pygame.JOYHATMOTION,
+    pygame.JOYBUTTONDOWN, pygame.JOYBUTTONUP,
+    pygame.FINGERDOWN, pygame.FINGERUP, pygame.FINGERMOTION,
+    pygame.AUDIODEVICEADDED, pygame.AUDIODEVICEREMOVED,
+)
+
+# Max rendered strings kept; the least recently drawn is dropped past this
+TEXT_CACHE_SIZE = 512
+
+_text_cache = OrderedDict()
+
+
+def render_text(font, text, color):
+    """Render text, reusing the surface from earlier frames while it is unchanged."""
+    key = (font, text, color)
+    surf = _text_cache.get(key)
+    if surf is None:
+        if len(_text_cache) >= TEXT_CACHE_SIZE:
+            _text_cache.popitem(last=False)
+        surf = font.render(text, True, color).convert_alpha()
+        _text_cache[key] = surf
+    else:
+        _text_cache.move_to_end(key)
+    return surf
+
 
 # ============================================================================
 # ROOM DATA
 # ============================================================================
 
+def read_room_file(filepath):
+    """Read and parse a room file."""
+    with open(filepath, 'rb') as f:
+        return json.loads(f.read())
+
+
+def write_room_file(filepath, data):
+    """Write already-encoded room data to a file."""
+    with open(filepath, 'wb') as f:
+        f.write(data)
+
+
 class RoomData:
     """Stores room tile data and metadata."""
     
     def __init__(self, width=DEFAULT_ROOM_WIDTH, height=DEFAULT_ROOM_HEIGHT):
         self.width = width
         self.height = height
-        self.tiles = [[TILE_EMPTY] * width for _ in range(height)]
+        # One bytearray per row: a byte per tile, and rows copy as one slice
+        self.tiles = [bytearray(width) for _ in range(height)]
+        # Flat tile list from the last to_json, and the bytes it was built from
+        self._flat_bytes = None
+        self._flat_data = None
         self.objects = []  # List of dicts: {type, x, y, w, h}
         # Single spawn point: (x, y) in tile coordinates
         self.spawn = None  # Set to (x, y) when placed
@@ -91,11 +147,9 @@ class RoomData:
     
     def resize(self, new_width, new_height):
         """Resize room, preserving existing tiles."""
-        new_tiles = [[TILE_EMPTY] * new_width for _ in range(new_height)]
-        
-        for y in range(min(self.height, new_height)):
-            for x in range(min(self.width, new_width)):
-                new_tiles[y][x] = self.tiles[y][x]
+        # Kept rows are cut or zero-padded (TILE_EMPTY) to the new width
+        new_tiles = [row[:new_width].ljust(new_width, b"\0") for row in self.tiles[:new_height]]
+        new_tiles.extend(bytearray(new_width) for _ in range(new_height - len(new_tiles)))
         
         self.tiles = new_tiles
         self.width = new_width
@@ -141,26 +195,52 @@ class RoomData:
     
     def fill_borders(self):
         """Fill room borders with solid tiles."""
-        for x in range(self.width):
-            self.tiles[0][x] = TILE_SOLID
-            self.tiles[self.height - 1][x] = TILE_SOLID
-        for y in range(self.height):
-            self.tiles[y][0] = TILE_SOLID
-            self.tiles[y][self.width - 1] = TILE_SOLID
+        solid_row = bytes((TILE_SOLID,)) * self.width
+        self.tiles[0][:] = solid_row
+        self.tiles[self.height - 1][:] = solid_row
+        # Top and bottom rows are already solid; only the side columns remain
+        for row in self.tiles[1:-1]:
+            row[0] = row[-1] = TILE_SOLID
         self.modified = True
     
     def clear(self):
         """Clear all tiles and objects."""
-        self.tiles = [[TILE_EMPTY] * self.width for _ in range(self.height)]
+        # Zero the existing rows in place (undo keeps its own copies)
+        empty_row = bytes(self.width)
+        for row in self.tiles:
+            row[:] = empty_row
         self.objects = []
         self.modified = True
     
     def to_json(self):
         """Convert to JSON format for game."""
-        # Flatten tile data
-        data = []
-        for row in self.tiles:
-            data.extend(row)
+        # Flatten tile data. Editor tools write rows directly, so the cached
+        # list is checked against the joined rows instead of a dirty flag
+        flat = b"".join(self.tiles)
+        if flat != self._flat_bytes:
+            self._flat_bytes = flat
+            self._flat_data = list(flat)
+        data = self._flat_data
+        
+        objects = []
+        if self.spawn:
+            objects.append({
+                "name": "spawn",
+                "type": "spawn",
+                "x": self.spawn[0] * TILE_SIZE,
+                "y": self.spawn[1] * TILE_SIZE
+            })
+        
+        # Add other objects
+        for obj in self.objects:
+            objects.append({
+                "name": obj["type"],
+                "type": obj["type"],
+                "x": obj["x"],
+                "y": obj["y"],
+                "width": obj["w"],
+                "height": obj["h"]
+            })
         
         return {
             "width": self.width,
@@ -178,46 +258,28 @@ class RoomData:
                 {
                     "name": "objects",
                     "type": "objectgroup",
-                    "objects": [
-                        {
-                            "name": "spawn",
-                            "type": "spawn",
-                            "x": self.spawn[0] * TILE_SIZE,
-                            "y": self.spawn[1] * TILE_SIZE
-                        }
-                    ] if self.spawn else []
+                    "objects": objects
                 }
             ]
         }
-        
-        # Add other objects
-        obj_layer = data["layers"][1]
-        for obj in self.objects:
-            obj_layer["objects"].append({
-                "name": obj["type"],
-                "type": obj["type"],
-                "x": obj["x"],
-                "y": obj["y"],
-                "width": obj["w"],
-                "height": obj["h"]
-            })
-            
-        return data
     
     def from_json(self, data):
         """Load from JSON data."""
         self.width = data.get("width", DEFAULT_ROOM_WIDTH)
         self.height = data.get("height", DEFAULT_ROOM_HEIGHT)
-        self.tiles = [[TILE_EMPTY] * self.width for _ in range(self.height)]
+        self.tiles = [bytearray(self.width) for _ in range(self.height)]
         
         for layer in data.get("layers", []):
             if layer.get("type") == "tilelayer" and "collision" in layer.get("name", "").lower():
                 tile_data = layer.get("data", [])
-                for y in range(self.height):
-                    for x in range(self.width):
-                        idx = y * self.width + x
-                        if idx < len(tile_data):
-                            self.tiles[y][x] = tile_data[idx]
+                width = self.width
+                for y, row in enumerate(self.tiles):
+                    chunk = tile_data[y * width:(y + 1) * width]
+                    try:
+                        row[:len(chunk)] = chunk
+                    except ValueError:
+                        # Raw Tiled gids above 255 don't fit a byte; treat them as solid
+                        row[:len(chunk)] = [t if 0 <= t < 256 else TILE_SOLID for t in chunk]
             
             elif layer.get("type") == "objectgroup":
                 for obj in layer.get("objects", []):
@@ -242,16 +304,14 @@ class RoomData:
     
     def save(self, filepath):
         """Save room to file."""
-        with open(filepath, 'w') as f:
-            json.dump(self.to_json(), f, indent=2)
+        # Rooms are machine-read, so they are saved without indentation
+        write_room_file(filepath, json_dumps(self.to_json()))
         self.filename = filepath
         self.modified = False
     
     def load(self, filepath):
         """Load room from file."""
-        with open(filepath, 'r') as f:
-            data = json.load(f)
-        self.from_json(data)
+        self.from_json(read_room_file(filepath))
         self.filename = filepath
         self.modified = False
 
@@ -272,7 +332,9 @@ class AutoTiler:
         try:
             # Load Ice tileset (3x3 grid)
             if os.path.exists("assets/tilesets/ice.png"):
-                img = pygame.image.load("assets/tilesets/ice.png").convert_alpha()
+                img = pygame.image.load("assets/tilesets/ice.png")
+                # Images without an alpha channel blit faster as plain display-format surfaces
+                img = img.convert_alpha() if img.get_flags() & pygame.SRCALPHA else img.convert()
                 self.tilesets[TILE_ICE] = self.split_tileset(img, 32)
         except Exception as e:
             print(f"Error loading assets: {e}")
@@ -282,8 +344,7 @@ class AutoTiler:
         tiles = []
         for y in range(3):
             for x in range(3):
-                rect = pygame.Rect(x*size, y*size, size, size)
-                tiles.append(img.subsurface(rect))
+                tiles.append(img.subsurface((x*size, y*size, size, size)))
         return tiles
 
     def get_tile_index(self, neighbors):
@@ -331,6 +392,23 @@ class AutoTiler:
 # UI COMPONENTS
 # ============================================================================
 
+def _button_color(state):
+    # state bits: 4 = enabled, 2 = active, 1 = hovered
+    if not state & 4:
+        return (30, 30, 35)
+    if state & 2:
+        return COLOR_BUTTON_ACTIVE
+    if state & 1:
+        return COLOR_BUTTON_HOVER
+    return COLOR_BUTTON
+
+
+# Button fill for each (enabled, active, hovered) combination, see Button.draw
+BUTTON_COLORS = tuple(_button_color(state) for state in range(8))
+# Button text color, indexed by enabled
+BUTTON_TEXT_COLORS = (COLOR_TEXT_DIM, COLOR_TEXT)
+
+
 class Button:
     """Simple clickable button."""
     
@@ -342,6 +420,10 @@ class Button:
         self.active = False
         self.hovered = False
         self.enabled = True
+        # Composed fill + border + label per state, built on first use; the
+        # key records what they were drawn with so a change rebuilds them
+        self._prerendered = {}
+        self._prerendered_key = None
     
     def update(self, mouse_pos, mouse_clicked):
         """Update button state, return True if clicked."""
@@ -355,24 +437,29 @@ class Button:
             return True
         return False
     
+    def _prerender(self, state, font):
+        """Compose the button's look for one state into a surface."""
+        surf = pygame.Surface(self.rect.size).convert()
+        local = surf.get_rect()
+        surf.fill(BUTTON_COLORS[state])
+        pygame.draw.rect(surf, COLOR_GRID_MAJOR, local, 1)
+        
+        text_surf = render_text(font, self.text, BUTTON_TEXT_COLORS[state >> 2])
+        surf.blit(text_surf, text_surf.get_rect(center=local.center))
+        return surf
+    
     def draw(self, surface, font):
         """Draw button."""
-        if not self.enabled:
-            color = (30, 30, 35)
-        elif self.active:
-            color = COLOR_BUTTON_ACTIVE
-        elif self.hovered:
-            color = COLOR_BUTTON_HOVER
-        else:
-            color = COLOR_BUTTON
-        
-        pygame.draw.rect(surface, color, self.rect)
-        pygame.draw.rect(surface, COLOR_GRID_MAJOR, self.rect, 1)
-        
-        text_color = COLOR_TEXT if self.enabled else COLOR_TEXT_DIM
-        text_surf = font.render(self.text, True, text_color)
-        text_rect = text_surf.get_rect(center=self.rect.center)
-        surface.blit(text_surf, text_rect)
+        key = (self.text, font, self.rect.size)
+        if key != self._prerendered_key:
+            self._prerendered.clear()
+            self._prerendered_key = key
+        
+        state = (self.enabled << 2) | (self.active << 1) | self.hovered
+        surf = self._prerendered.get(state)
+        if surf is None:
+            surf = self._prerendered[state] = self._prerender(state, font)
+        surface.blit(surf, self.rect)
 
 
 class TileButton(Button):
@@ -382,6 +469,12 @@ class TileButton(Button):
         super().__init__(x, y, size, size, "", toggle=True)
         self.tile_type = tile_type
         self.size = size
+        self.label = TILE_NAMES[tile_type][:3].upper()
+        # Rendered on first draw (the font comes from the editor), with its
+        # x offset under the button; only the y moves as the sidebar scrolls
+        self._label_font = None
+        self._label_surf = None
+        self._label_dx = 0
     
     def draw(self, surface, font):
         """Draw tile button with color."""
@@ -390,17 +483,18 @@ class TileButton(Button):
             pygame.draw.rect(surface, COLOR_ACCENT, self.rect.inflate(4, 4))
         
         # Tile color
-        pygame.draw.rect(surface, TILE_COLORS[self.tile_type], self.rect)
+        pygame.draw.rect(surface, TILE_COLOR_BY_TYPE[self.tile_type], self.rect)
         
         # Border
         border_color = COLOR_TEXT if self.hovered else COLOR_GRID_MAJOR
         pygame.draw.rect(surface, border_color, self.rect, 2)
         
         # Label below
-        label = TILE_NAMES[self.tile_type][:3].upper()
-        text_surf = font.render(label, True, COLOR_TEXT_DIM)
-        text_rect = text_surf.get_rect(centerx=self.rect.centerx, top=self.rect.bottom + 2)
-        surface.blit(text_surf, text_rect)
+        if self._label_font is not font:
+            self._label_font = font
+            self._label_surf = render_text(font, self.label, COLOR_TEXT_DIM)
+            self._label_dx = self.rect.width // 2 - self._label_surf.get_width() // 2
+        surface.blit(self._label_surf, (self.rect.x + self._label_dx, self.rect.bottom + 2))
 
 
 class InputBox:
@@ -413,6 +507,11 @@ class InputBox:
         self.active = False
         self.cursor_visible = True
         self.cursor_timer = 0
+        # Text placement only depends on the font, so it is worked out on
+        # the first draw with that font
+        self._layout_font = None
+        self._label_pos = (x, y - 18)
+        self._text_pos = (x + 5, y)
     
     def handle_event(self, event):
         """Handle input events."""
@@ -425,8 +524,11 @@ class InputBox:
                 return True
             elif event.key == pygame.K_BACKSPACE:
                 self.text = self.text[:-1]
-            elif event.unicode.isdigit():
-                self.text += event.unicode
+            else:
+                # Plain ASCII digits only (isdigit would also take other scripts' digits)
+                u = event.unicode
+                if len(u) == 1 and "0" <= u <= "9":
+                    self.text += u
         
         return False
     
@@ -450,10 +552,15 @@ class InputBox:
     
     def draw(self, surface, font):
         """Draw input box."""
+        if font is not self._layout_font:
+            # Any non-empty line renders at the font's line height
+            self._layout_font = font
+            self._text_pos = (self.rect.x + 5, self.rect.centery - font.get_linesize() // 2)
+        
         # Label
         if self.label:
-            label_surf = font.render(self.label, True, COLOR_TEXT_DIM)
-            surface.blit(label_surf, (self.rect.x, self.rect.y - 18))
+            label_surf = render_text(font, self.label, COLOR_TEXT_DIM)
+            surface.blit(label_surf, self._label_pos)
         
         # Box
         color = COLOR_BUTTON_HOVER if self.active else COLOR_BUTTON
@@ -461,20 +568,35 @@ class InputBox:
         pygame.draw.rect(surface, COLOR_ACCENT if self.active else COLOR_GRID_MAJOR, self.rect, 1)
         
         # Text
-        text_surf = font.render(self.text, True, COLOR_TEXT)
-        surface.blit(text_surf, (self.rect.x + 5, self.rect.centery - text_surf.get_height() // 2))
+        text_surf = render_text(font, self.text, COLOR_TEXT)
+        surface.blit(text_surf, self._text_pos)
         
         # Cursor
         if self.active and self.cursor_visible:
-            cursor_x = self.rect.x + 5 + text_surf.get_width()
+            cursor_x = self._text_pos[0] + text_surf.get_width()
             pygame.draw.line(surface, COLOR_TEXT, 
                            (cursor_x, self.rect.y + 4), 
                            (cursor_x, self.rect.bottom - 4), 2)
 
 
+_dim_surf = None
+
+
+def dim_overlay(size):
+    """Translucent black overlay for dialogs, rebuilt only when the screen size changes."""
+    global _dim_surf
+    if _dim_surf is None or _dim_surf.get_size() != size:
+        _dim_surf = pygame.Surface(size, pygame.SRCALPHA).convert_alpha()
+        _dim_surf.fill((0, 0, 0, 150))
+    return _dim_surf
+
+
 class FileDialog:
     """Simple file browser dialog."""
     
+    # (directory, extension) -> (directory mtime_ns, sorted file names)
+    _dir_cache = {}
+    
     def __init__(self, x, y, width, height, directory, extension=".json", save_mode=False):
         self.rect = pygame.Rect(x, y, width, height)
         self.directory = directory
@@ -486,15 +608,33 @@ class FileDialog:
         self.filename_input = InputBox(x + 10, y + height - 70, width - 20, 28, "", "Filename:")
         self.active = False
         self.result = None
-        self.refresh_files()
+        # The list is only read while open, so it is first filled by open()
+        self._needs_scroll = False
     
     def refresh_files(self):
-        """Refresh file list."""
-        self.files = []
-        if os.path.exists(self.directory):
-            for f in sorted(os.listdir(self.directory)):
-                if f.endswith(self.extension):
-                    self.files.append(f)
+        """Refresh file list, rescanning only if the directory changed."""
+        try:
+            mtime = os.stat(self.directory).st_mtime_ns
+        except OSError:
+            self.files = []
+            self._set_needs_scroll()
+            return
+        
+        key = (self.directory, self.extension)
+        cached = FileDialog._dir_cache.get(key)
+        if cached is None or cached[0] != mtime:
+            with os.scandir(self.directory) as entries:
+                names = sorted(e.name for e in entries if e.name.endswith(self.extension))
+            cached = FileDialog._dir_cache[key] = (mtime, names)
+        self.files = list(cached[1])
+        self._set_needs_scroll()
+    
+    def _set_needs_scroll(self):
+        """Note whether the file list is taller than the list area."""
+        content_height = len(self.files) * 24
+        self._needs_scroll = content_height > self.rect.height - 130
+        if not self._needs_scroll:
+            self.scroll = 0
     
     def open(self, save_mode=False):
         """Open dialog."""
@@ -531,12 +671,13 @@ class FileDialog:
                     if not self.save_mode:
                         self.filename_input.text = self.files[idx]
             
-            # Check scroll
-            if event.button == 4:  # Scroll up
-                self.scroll = max(0, self.scroll - 24)
-            elif event.button == 5:  # Scroll down
-                max_scroll = max(0, len(self.files) * 24 - (self.rect.height - 130))
-                self.scroll = min(max_scroll, self.scroll + 24)
+            # Check scroll (a list that fits never moves)
+            if self._needs_scroll:
+                if event.button == 4:  # Scroll up
+                    self.scroll = max(0, self.scroll - 24)
+                elif event.button == 5:  # Scroll down
+                    max_scroll = max(0, len(self.files) * 24 - (self.rect.height - 130))
+                    self.scroll = min(max_scroll, self.scroll + 24)
         
         # Filename input
         if self.save_mode:
@@ -576,6 +717,8 @@ class FileDialog:
     
     def update(self, dt):
         """Update dialog."""
+        if not self.active:
+            return
         if self.save_mode:
             self.filename_input.update(dt)
     
@@ -585,9 +728,7 @@ class FileDialog:
             return
         
         # Dim background
-        dim = pygame.Surface(surface.get_size(), pygame.SRCALPHA)
-        dim.fill((0, 0, 0, 150))
-        surface.blit(dim, (0, 0))
+        surface.blit(dim_overlay(surface.get_size()), (0, 0))
         
         # Dialog box
         pygame.draw.rect(surface, COLOR_PANEL, self.rect)
@@ -595,7 +736,7 @@ class FileDialog:
         
         # Title
         title = "Save Room" if self.save_mode else "Open Room"
-        title_surf = font.render(title, True, COLOR_TEXT)
+        title_surf = render_text(font, title, COLOR_TEXT)
         surface.blit(title_surf, (self.rect.x + 10, self.rect.y + 10))
         
         # File list
@@ -603,23 +744,41 @@ class FileDialog:
                                self.rect.width - 20, self.rect.height - 130)
         pygame.draw.rect(surface, COLOR_BG, list_rect)
         
-        # Clip to list area
-        clip = surface.get_clip()
-        surface.set_clip(list_rect)
-        
-        for i, filename in enumerate(self.files):
-            y = list_rect.y + i * 24 - self.scroll
-            if y < list_rect.y - 24 or y > list_rect.bottom:
-                continue
-            
-            if i == self.selected:
-                pygame.draw.rect(surface, COLOR_BUTTON_HOVER,
-                               (list_rect.x, y, list_rect.width, 24))
-            
-            text_surf = font.render(filename, True, COLOR_TEXT)
-            surface.blit(text_surf, (list_rect.x + 5, y + 4))
+        if not self._needs_scroll:
+            # Every row fits, so nothing needs clipping
+            blit = surface.blit
+            x, top, text = list_rect.x, list_rect.y, COLOR_TEXT
+            for i, filename in enumerate(self.files):
+                y = top + i * 24
+                
+                if i == self.selected:
+                    pygame.draw.rect(surface, COLOR_BUTTON_HOVER,
+                                   (x, y, list_rect.width, 24))
+                
+                blit(render_text(font, filename, text), (x + 5, y + 4))
+        else:
+            # Rows go into a subsurface of the on-screen part of the list,
+            # which clips them without touching the surface's own clip rect
+            area = list_rect.clip(surface.get_rect())
+            if area.width and area.height:
+                view = surface.subsurface(area)
+                ox = list_rect.x - area.x
+                oy = list_rect.y - area.y - self.scroll
+                
+                # Only the rows in (or touching) the visible list area
+                first = max(0, (self.scroll - 1) // 24)
+                last = min(len(self.files), (self.scroll + list_rect.height) // 24 + 1)
+                blit = view.blit
+                files, text = self.files, COLOR_TEXT
+                for i in range(first, last):
+                    y = oy + i * 24
+                    
+                    if i == self.selected:
+                        pygame.draw.rect(view, COLOR_BUTTON_HOVER,
+                                       (ox, y, list_rect.width, 24))
+                    
+                    blit(render_text(font, files[i], text), (ox + 5, y + 4))
         
-        surface.set_clip(clip)
         pygame.draw.rect(surface, COLOR_GRID_MAJOR, list_rect, 1)
         
         # Filename input (save mode)
@@ -639,24 +798,38 @@ class FileDialog:
         pygame.draw.rect(surface, COLOR_GRID_MAJOR, cancel_rect, 1)
         pygame.draw.rect(surface, COLOR_ACCENT, confirm_rect, 1)
         
-        cancel_surf = font.render("Cancel", True, COLOR_TEXT)
-        confirm_surf = font.render(confirm_text, True, COLOR_TEXT)
+        cancel_surf = render_text(font, "Cancel", COLOR_TEXT)
+        confirm_surf = render_text(font, confirm_text, COLOR_TEXT)
         surface.blit(cancel_surf, cancel_surf.get_rect(center=cancel_rect.center))
         surface.blit(confirm_surf, confirm_surf.get_rect(center=confirm_rect.center))
 
 
+# rooms_dir -> (directory mtime_ns, room names)
+_room_names_cache = {}
+
+
+def list_room_names(rooms_dir):
+    """Room names (file names without .json, world.json excluded) in file-name order."""
+    try:
+        mtime = os.stat(rooms_dir).st_mtime_ns
+    except OSError:
+        return []
+    
+    cached = _room_names_cache.get(rooms_dir)
+    if cached is None or cached[0] != mtime:
+        with os.scandir(rooms_dir) as entries:
+            files = sorted(e.name for e in entries if e.name.endswith('.json') and e.name != 'world.json')
+        cached = _room_names_cache[rooms_dir] = (mtime, [f[:-5] for f in files])
+    return cached[1]
+
+
 class EntryPointEditor:
     """Dialog for editing entry point properties with room dropdown."""
     
     def __init__(self, x, y, entry_index, from_room, callback, rooms_dir, is_start=False):
         # Get available rooms first
         self.available_rooms = ["start"]  # Always include start
-        if os.path.exists(rooms_dir):
-            for f in sorted(os.listdir(rooms_dir)):
-                if f.endswith('.json') and f != 'world.json':
-                    room_name = f.replace('.json', '')
-                    if room_name not in self.available_rooms:
-                        self.available_rooms.append(room_name)
+        self.available_rooms += [r for r in list_room_names(rooms_dir) if r != "start"]
         
         # Calculate dialog height based on number of rooms (max 8 visible options)
         max_visible_options = min(8, len(self.available_rooms))
@@ -685,11 +858,10 @@ class EntryPointEditor:
         self.active = True
         
         # Dropdown for room selection
-        self.selected_room_index = 0
-        for i, room in enumerate(self.available_rooms):
-            if room == from_room:
-                self.selected_room_index = i
-                break
+        try:
+            self.selected_room_index = self.available_rooms.index(from_room)
+        except ValueError:
+            self.selected_room_index = 0
         
         self.dropdown_rect = pygame.Rect(x + 10, y + 40, 230, 24)
         self.dropdown_expanded = False
@@ -699,9 +871,48 @@ class EntryPointEditor:
         self.max_visible_options = max_visible_options
         self.option_height = 24
         
+        # Each visible dropdown slot keeps its rect; scrolling only changes
+        # which room is shown in it
+        options_start_y = y + 40 + 24
+        self.option_rects = [
+            pygame.Rect(x + 10, options_start_y + i * self.option_height, 230, self.option_height)
+            for i in range(self.max_visible_options)
+        ]
+        self.up_arrow_rect = pygame.Rect(self.rect.right - 20, options_start_y, 10, 15)
+        self.down_arrow_rect = pygame.Rect(self.rect.right - 20, options_start_y + self.max_visible_options * self.option_height - 15, 10, 15)
+        
+        # Fixed draw geometry (the dialog never moves once placed)
+        dropdown = self.dropdown_rect
+        self._dropdown_arrow_points = [
+            (dropdown.right - 15, dropdown.centery - 3),
+            (dropdown.right - 10, dropdown.centery + 3),
+            (dropdown.right - 5, dropdown.centery - 3)
+        ]
+        options_area_height = self.max_visible_options * self.option_height
+        self.options_rect = pygame.Rect(x + 10, options_start_y, 230, options_area_height)
+        self._checkbox_label_pos = (x + 35, options_start_y + options_area_height + 12)
+        right = self.rect.right
+        self._up_arrow_points = [
+            (right - 15, options_start_y + 7),
+            (right - 10, options_start_y + 2),
+            (right - 5, options_start_y + 7)
+        ]
+        options_bottom = options_start_y + options_area_height
+        self._down_arrow_points = [
+            (right - 15, options_bottom - 7),
+            (right - 10, options_bottom - 2),
+            (right - 5, options_bottom - 7)
+        ]
+        
         # Checkbox for start point
         self.is_start_checkbox = pygame.Rect(x + 10, y + 40 + 24 + self.max_visible_options * self.option_height + 10, 20, 20)
         self.is_start = is_start
+        box = self.is_start_checkbox
+        self._checkmark_points = [
+            (box.left + 3, box.centery),
+            (box.centerx - 1, box.bottom - 3),
+            (box.right - 3, box.top + 3)
+        ]
         
         # Buttons - position them below the checkbox area
         button_y = y + 40 + 24 + self.max_visible_options * self.option_height + 40
@@ -742,40 +953,24 @@ class EntryPointEditor:
             elif self.is_start_checkbox.collidepoint(mouse_pos):
                 self.is_start = not self.is_start
             elif self.dropdown_expanded:
-                # Check if clicking on options
-                options_start_y = self.rect.y + 40 + 24
-                for i in range(self.max_visible_options):
-                    option_index = self.scroll_offset + i
-                    if option_index >= len(self.available_rooms):
-                        break
-                    
-                    option_rect = pygame.Rect(
-                        self.rect.x + 10, 
-                        options_start_y + i * self.option_height, 
-                        230, 
-                        self.option_height
-                    )
-                    
-                    if option_rect.collidepoint(mouse_pos):
+                # Check if clicking on options; the rows stack evenly inside
+                # options_rect, so one hit test gives the row by division
+                if self.options_rect.collidepoint(mouse_pos):
+                    row = (mouse_pos[1] - self.options_rect.y) // self.option_height
+                    option_index = self.scroll_offset + row
+                    if option_index < len(self.available_rooms):
                         self.selected_room_index = option_index
                         self.dropdown_expanded = False
-                        break
                 
                 # Check scroll buttons (if needed)
                 if len(self.available_rooms) > self.max_visible_options:
                     # Up arrow
-                    up_arrow_rect = pygame.Rect(self.rect.right - 20, options_start_y, 10, 15)
-                    if up_arrow_rect.collidepoint(mouse_pos) and self.scroll_offset > 0:
+                    if self.up_arrow_rect.collidepoint(mouse_pos) and self.scroll_offset > 0:
                         self.scroll_offset -= 1
                     
                     # Down arrow  
-                    down_arrow_rect = pygame.Rect(self.rect.right - 20, options_start_y + self.max_visible_options * self.option_height - 15, 10, 15)
-                    if down_arrow_rect.collidepoint(mouse_pos) and self.scroll_offset < len(self.available_rooms) - self.max_visible_options:
+                    if self.down_arrow_rect.collidepoint(mouse_pos) and self.scroll_offset < len(self.available_rooms) - self.max_visible_options:
                         self.scroll_offset += 1
-            
-            # Handle checkbox
-            elif self.is_start_checkbox.collidepoint(mouse_pos):
-                self.is_start = not self.is_start
         
         elif event.type == pygame.MOUSEWHEEL and self.dropdown_expanded:
             if event.y > 0 and self.scroll_offset > 0:
@@ -791,6 +986,8 @@ class EntryPointEditor:
     
     def update(self, dt, mouse_pos):
         """Update dialog state."""
+        if not self.active:
+            return
         self.last_mouse_pos = mouse_pos
         
         # Update buttons
@@ -806,37 +1003,32 @@ class EntryPointEditor:
             return
         
         # Dim background
-        dim = pygame.Surface(surface.get_size(), pygame.SRCALPHA)
-        dim.fill((0, 0, 0, 150))
-        surface.blit(dim, (0, 0))
+        surface.blit(dim_overlay(surface.get_size()), (0, 0))
         
         # Dialog box
         pygame.draw.rect(surface, COLOR_PANEL, self.rect)
         pygame.draw.rect(surface, COLOR_ACCENT, self.rect, 2)
         
         # Title
-        title_surf = font.render("Edit Entry Point", True, COLOR_TEXT)
+        title_surf = render_text(font, "Edit Entry Point", COLOR_TEXT)
         surface.blit(title_surf, (self.rect.x + 10, self.rect.y + 10))
         
         # Label
-        label_surf = font.render("From Room:", True, COLOR_TEXT_DIM)
+        label_surf = render_text(font, "From Room:", COLOR_TEXT_DIM)
         surface.blit(label_surf, (self.rect.x + 10, self.rect.y + 25))
         
         # Checkbox for start point
-        checkbox_label_surf = font.render("Make this the start point", True, COLOR_TEXT_DIM)
-        surface.blit(checkbox_label_surf, (self.rect.x + 35, self.rect.y + 40 + 24 + self.max_visible_options * self.option_height + 12))
+        checkbox_label_surf = render_text(font, "Make this the start point", COLOR_TEXT_DIM)
+        surface.blit(checkbox_label_surf, self._checkbox_label_pos)
         
         # Checkbox
         pygame.draw.rect(surface, COLOR_BUTTON, self.is_start_checkbox)
         pygame.draw.rect(surface, COLOR_GRID_MAJOR, self.is_start_checkbox, 1)
         if self.is_start:
             # Draw checkmark
-            pygame.draw.line(surface, COLOR_TEXT, 
-                           (self.is_start_checkbox.left + 3, self.is_start_checkbox.centery),
-                           (self.is_start_checkbox.centerx - 1, self.is_start_checkbox.bottom - 3), 2)
-            pygame.draw.line(surface, COLOR_TEXT,
-                           (self.is_start_checkbox.centerx - 1, self.is_start_checkbox.bottom - 3),
-                           (self.is_start_checkbox.right - 3, self.is_start_checkbox.top + 3), 2)
+            start, corner, end = self._checkmark_points
+            pygame.draw.line(surface, COLOR_TEXT, start, corner, 2)
+            pygame.draw.line(surface, COLOR_TEXT, corner, end, 2)
         
         # Dropdown button
         dropdown_color = COLOR_BUTTON_HOVER if self.dropdown_rect.collidepoint(self.last_mouse_pos) else COLOR_BUTTON
@@ -845,68 +1037,44 @@ class EntryPointEditor:
         
         # Selected room text
         selected_room = self.available_rooms[self.selected_room_index]
-        text_surf = font.render(selected_room, True, COLOR_TEXT)
+        text_surf = render_text(font, selected_room, COLOR_TEXT)
         surface.blit(text_surf, (self.dropdown_rect.x + 5, self.dropdown_rect.y + 4))
         
         # Dropdown arrow
-        arrow_points = [
-            (self.dropdown_rect.right - 15, self.dropdown_rect.centery - 3),
-            (self.dropdown_rect.right - 10, self.dropdown_rect.centery + 3),
-            (self.dropdown_rect.right - 5, self.dropdown_rect.centery - 3)
-        ]
-        pygame.draw.polygon(surface, COLOR_TEXT, arrow_points)
+        pygame.draw.polygon(surface, COLOR_TEXT, self._dropdown_arrow_points)
         
         # Dropdown options (when expanded)
         if self.dropdown_expanded:
-            options_area_height = self.max_visible_options * self.option_height
-            expanded_rect = pygame.Rect(
-                self.rect.x + 10, 
-                self.rect.y + 40 + 24, 
-                230, 
-                options_area_height
-            )
-            pygame.draw.rect(surface, COLOR_BG, expanded_rect)
-            pygame.draw.rect(surface, COLOR_ACCENT, expanded_rect, 1)
+            pygame.draw.rect(surface, COLOR_BG, self.options_rect)
+            pygame.draw.rect(surface, COLOR_ACCENT, self.options_rect, 1)
             
             # Draw visible options
-            for i in range(self.max_visible_options):
+            draw_rect = pygame.draw.rect
+            blit = surface.blit
+            rooms = self.available_rooms
+            mouse_pos = self.last_mouse_pos
+            hover, bg, text = COLOR_BUTTON_HOVER, COLOR_BG, COLOR_TEXT
+            for i, option_rect in enumerate(self.option_rects):
                 option_index = self.scroll_offset + i
-                if option_index >= len(self.available_rooms):
+                if option_index >= len(rooms):
                     break
                 
-                room = self.available_rooms[option_index]
-                option_rect = pygame.Rect(
-                    self.rect.x + 10, 
-                    self.rect.y + 40 + 24 + i * self.option_height, 
-                    230, 
-                    self.option_height
-                )
+                room = rooms[option_index]
+                option_color = hover if option_rect.collidepoint(mouse_pos) else bg
+                draw_rect(surface, option_color, option_rect)
                 
-                option_color = COLOR_BUTTON_HOVER if option_rect.collidepoint(self.last_mouse_pos) else COLOR_BG
-                pygame.draw.rect(surface, option_color, option_rect)
-                
-                text_surf = font.render(room, True, COLOR_TEXT)
-                surface.blit(text_surf, (option_rect.x + 5, option_rect.y + 4))
+                text_surf = render_text(font, room, text)
+                blit(text_surf, (option_rect.x + 5, option_rect.y + 4))
             
             # Draw scroll indicators if needed
             if len(self.available_rooms) > self.max_visible_options:
                 # Up arrow
                 up_color = COLOR_TEXT if self.scroll_offset > 0 else COLOR_TEXT_DIM
-                up_points = [
-                    (self.rect.right - 15, self.rect.y + 40 + 24 + 7),
-                    (self.rect.right - 10, self.rect.y + 40 + 24 + 2),
-                    (self.rect.right - 5, self.rect.y + 40 + 24 + 7)
-                ]
-                pygame.draw.polygon(surface, up_color, up_points)
+                pygame.draw.polygon(surface, up_color, self._up_arrow_points)
                 
                 # Down arrow
                 down_color = COLOR_TEXT if self.scroll_offset < len(self.available_rooms) - self.max_visible_options else COLOR_TEXT_DIM
-                down_points = [
-                    (self.rect.right - 15, self.rect.y + 40 + 24 + options_area_height - 7),
-                    (self.rect.right - 10, self.rect.y + 40 + 24 + options_area_height - 2),
-                    (self.rect.right - 5, self.rect.y + 40 + 24 + options_area_height - 7)
-                ]
-                pygame.draw.polygon(surface, down_color, down_points)
+                pygame.draw.polygon(surface, down_color, self._down_arrow_points)
         
         # Buttons
         self.ok_btn.draw(surface, font)
@@ -938,6 +1106,7 @@ class RoomEditor:
             self.rooms_dir = rooms_dir
             
         self.clock = pygame.time.Clock()
+        self.target_fps = 60
         self.running = True
         
         # Fonts
@@ -951,6 +1120,15 @@ class RoomEditor:
         
         self.autotiler = AutoTiler()
         
+        # Room tiles at 1x, redrawn row by row when a row's bytes change
+        self._tile_surf = None
+        self._tile_rows = []
+        # Bumped whenever _tile_surf changes; the zoomed view of it is reused
+        # while its key (source rect, output size, version) stays the same
+        self._tile_version = 0
+        self._scaled_key = None
+        self._scaled_surf = None
+        
         # View
         self.zoom = 1.0
         self.min_zoom = 0.25
@@ -965,6 +1143,9 @@ class RoomEditor:
         self.tool = "paint"  # paint, fill, line, rect, spawn, entry, platform
         self.painting = False
         self.erasing = False
+        # (x, y, tile) of the last paint in this stroke; x, y are the 2x2
+        # block's corner for solid/ice. Motion within it paints nothing new
+        self._last_painted_tile = None
         
         # Line/rect tool state
         self.line_start = None
@@ -982,10 +1163,17 @@ class RoomEditor:
         # File dialog
         self.file_dialog = FileDialog(200, 100, 400, 400, rooms_dir)
         
-        # Undo/redo
+        # Undo/redo. The stacks hold delta records (see _diff_undo_base);
+        # _undo_base is the room as it was when the open action started
         self.undo_stack = []
         self.redo_stack = []
         self.max_undo = 50
+        self._undo_base = None
+        
+        # Room file I/O runs on one worker thread so a slow disk doesn't stall
+        # the editor; _pending_io is (kind, path, future) until it is applied
+        self._io_pool = ThreadPoolExecutor(max_workers=1)
+        self._pending_io = None
         
         # Message
         self.message = ""
@@ -1041,6 +1229,13 @@ class RoomEditor:
         
         # Back Button (Far Right)
         self.exit_btn = Button(1150, toolbar_y, 100, btn_h, "Exit", self.exit_editor)
+        
+        # Toolbar buttons sit in one row, so sorted left edges find the one
+        # under the mouse with a bisect instead of testing every button
+        self._toolbar_buttons = sorted(self.action_buttons + self.tool_buttons + [self.resize_btn, self.exit_btn],
+                                       key=lambda b: b.rect.left)
+        self._toolbar_lefts = [b.rect.left for b in self._toolbar_buttons]
+        self._toolbar_hovered = None
 
 
         # --- Sidebar Elements (Left) ---
@@ -1078,35 +1273,87 @@ class RoomEditor:
         self.message_timer = duration
     
     def save_undo(self):
-        """Save current state for undo."""
-        state = {
-            'tiles': [row[:] for row in self.room.tiles],
-            'objects': [obj.copy() for obj in self.room.objects],
-            'spawn': self.room.spawn
-        }
-        self.undo_stack.append(state)
+        """Start a new undoable action from the current state."""
+        self._close_undo_action()
+        self.redo_stack.clear()
+        
+        # Tools write tiles in many ways (set_tile, row slices, whole-room
+        # ops), so the action's delta is found later by comparing against this
+        room = self.room
+        self._undo_base = (room.width, room.height, [bytes(row) for row in room.tiles],
+                           [obj.copy() for obj in room.objects], room.spawn)
+    
+    def _close_undo_action(self):
+        """Push the open action's delta, if it changed anything."""
+        if self._undo_base is None:
+            return
+        record = self._diff_undo_base(self._undo_base)
+        self._undo_base = None
+        if record is None:
+            return
+        
+        self.undo_stack.append(record)
         if len(self.undo_stack) > self.max_undo:
             self.undo_stack.pop(0)
+    
+    def _diff_undo_base(self, base):
+        """Delta record from base to the current room, or None if unchanged.
+        
+        Each changed part is kept as an (old, new) pair: 'rows' is a list of
+        (y, old_row, new_row), and 'size' holds (width, height, rows) for the
+        whole grid when the room was resized.
+        """
+        width, height, tiles, objects, spawn = base
+        room = self.room
+        record = {'rows': [], 'size': None, 'objects': None, 'spawn': None}
+        
+        if (width, height) != (room.width, room.height):
+            record['size'] = ((width, height, tiles),
+                              (room.width, room.height, [bytes(row) for row in room.tiles]))
+        else:
+            record['rows'] = [(y, old, bytes(row))
+                              for y, (old, row) in enumerate(zip(tiles, room.tiles))
+                              if old != row]
+        if objects != room.objects:
+            record['objects'] = (objects, [obj.copy() for obj in room.objects])
+        if spawn != room.spawn:
+            record['spawn'] = (spawn, room.spawn)
+        
+        if record['rows'] or record['size'] or record['objects'] or record['spawn']:
+            return record
+        return None
+    
+    def _apply_undo_record(self, record, side):
+        """Write one side of a delta record into the room (0 = old, 1 = new)."""
+        room = self.room
+        if record['size']:
+            room.width, room.height, tiles = record['size'][side]
+            room.tiles = [bytearray(row) for row in tiles]
+        for change in record['rows']:
+            room.tiles[change[0]][:] = change[1 + side]
+        if record['objects']:
+            room.objects = [obj.copy() for obj in record['objects'][side]]
+        if record['spawn']:
+            room.spawn = record['spawn'][side]
+        room.modified = True
+        # Tiles under the current stroke may have changed back
+        self._last_painted_tile = None
+    
+    def _reset_undo(self):
+        """Forget all undo history (the room was replaced)."""
+        self.undo_stack.clear()
         self.redo_stack.clear()
+        self._undo_base = None
     
     def undo(self):
         """Undo last action."""
+        self._close_undo_action()
         if not self.undo_stack:
             return
         
-        # Save current for redo
-        current = {
-            'tiles': [row[:] for row in self.room.tiles],
-            'spawn': self.room.spawn
-        }
-        self.redo_stack.append(current)
-        
-        # Restore previous
-        state = self.undo_stack.pop()
-        self.room.tiles = state['tiles']
-        self.room.objects = state.get('objects', [])
-        self.room.spawn = state['spawn']
-        self.room.modified = True
+        record = self.undo_stack.pop()
+        self._apply_undo_record(record, 0)
+        self.redo_stack.append(record)
         self.show_message("Undo")
     
     def redo(self):
@@ -1114,19 +1361,9 @@ class RoomEditor:
         if not self.redo_stack:
             return
         
-        # Save current for undo
-        current = {
-            'tiles': [row[:] for row in self.room.tiles],
-            'spawn': self.room.spawn
-        }
-        self.undo_stack.append(current)
-        
-        # Restore
-        state = self.redo_stack.pop()
-        self.room.tiles = state['tiles']
-        self.room.objects = state.get('objects', [])
-        self.room.spawn = state['spawn']
-        self.room.modified = True
+        record = self.redo_stack.pop()
+        self._apply_undo_record(record, 1)
+        self.undo_stack.append(record)
         self.show_message("Redo")
     
     def new_room(self):
@@ -1135,8 +1372,7 @@ class RoomEditor:
         self.room.fill_borders()
         self.width_input.set_value(self.room.width)
         self.height_input.set_value(self.room.height)
-        self.undo_stack.clear()
-        self.redo_stack.clear()
+        self._reset_undo()
         self.center_view()
         self.show_message("New room created")
     
@@ -1146,9 +1382,11 @@ class RoomEditor:
     
     def save_room(self):
         """Save current room."""
+        # A pending load must land first: it replaces the room and its
+        # filename, and saving before it would write into the wrong file
+        self.finish_io(wait=True)
         if self.room.filename:
-            self.room.save(self.room.filename)
-            self.show_message(f"Saved: {os.path.basename(self.room.filename)}")
+            self.save_in_background(self.room.filename)
         else:
             self.save_room_as()
     
@@ -1156,6 +1394,61 @@ class RoomEditor:
         """Open file dialog to save room."""
         self.file_dialog.open(save_mode=True)
     
+    def save_in_background(self, filepath):
+        """Save the room on the I/O thread."""
+        self.finish_io(wait=True)
+        # Encoded here, so the worker never reads a room that is being edited
+        data = json_dumps(self.room.to_json())
+        self.room.filename = filepath
+        self.room.modified = False
+        future = self._io_pool.submit(write_room_file, filepath, data)
+        self._pending_io = ("save", filepath, future)
+        self.show_message("Saving...")
+    
+    def load_in_background(self, filepath):
+        """Read a room file on the I/O thread; it replaces the room once read."""
+        self.finish_io(wait=True)
+        future = self._io_pool.submit(read_room_file, filepath)
+        self._pending_io = ("load", filepath, future)
+        # Stays up until finish_io replaces it; input is ignored meanwhile
+        self.show_message("Loading...", duration=float("inf"))
+    
+    def _loading(self):
+        """True while a background load has yet to replace the room."""
+        return self._pending_io is not None and self._pending_io[0] == "load"
+    
+    def finish_io(self, wait=False):
+        """Apply a finished save or load; with wait, block until it is done."""
+        if self._pending_io is None:
+            return
+        kind, filepath, future = self._pending_io
+        if not (wait or future.done()):
+            return
+        self._pending_io = None
+        name = os.path.basename(filepath)
+        
+        try:
+            data = future.result()
+        except (OSError, ValueError) as e:
+            if kind == "save":
+                self.room.modified = True
+            self.show_message(f"Failed to {kind} {name}: {e}")
+            return
+        
+        if kind == "save":
+            self.show_message(f"Saved: {name}")
+        else:
+            self.room.from_json(data)
+            self.room.filename = filepath
+            self.room.modified = False
+            # Undo history and any stroke in progress belong to the old room
+            self._reset_undo()
+            self.painting = False
+            self.line_start = None
+            self.width_input.set_value(self.room.width)
+            self.height_input.set_value(self.room.height)
+            self.show_message(f"Loaded: {name}")
+    
     def clear_room(self):
         """Clear all tiles."""
         self.save_undo()
@@ -1197,11 +1490,16 @@ class RoomEditor:
         self.camera_x = (canvas_width - room_pixel_width) / 2
         self.camera_y = (canvas_height - room_pixel_height) / 2
     
-    def screen_to_tile(self, screen_x, screen_y):
-        """Convert screen position to tile coordinates."""
+    def screen_to_world(self, screen_x, screen_y):
+        """Convert screen position to unzoomed room pixel coordinates."""
         # Adjust for sidebar and toolbar
         world_x = (screen_x - self.sidebar_width - self.camera_x) / self.zoom
         world_y = (screen_y - self.toolbar_height - self.camera_y) / self.zoom
+        return world_x, world_y
+    
+    def screen_to_tile(self, screen_x, screen_y):
+        """Convert screen position to tile coordinates."""
+        world_x, world_y = self.screen_to_world(screen_x, screen_y)
         
         tile_x = int(world_x // TILE_SIZE)
         tile_y = int(world_y // TILE_SIZE)
@@ -1215,27 +1513,46 @@ class RoomEditor:
         return screen_x, screen_y
     
     def flood_fill(self, start_x, start_y, target_tile, replacement_tile):
-        """Flood fill algorithm."""
+        """Scanline flood fill."""
         if target_tile == replacement_tile:
             return
         
+        tiles = self.room.tiles
+        width, height = self.room.width, self.room.height
+        # Filled tiles no longer match the target, so they need no visited set
         stack = [(start_x, start_y)]
-        visited = set()
         
         while stack:
             x, y = stack.pop()
             
-            if (x, y) in visited:
+            if not (0 <= x < width and 0 <= y < height):
                 continue
-            if not (0 <= x < self.room.width and 0 <= y < self.room.height):
-                continue
-            if self.room.tiles[y][x] != target_tile:
+            row = tiles[y]
+            if row[x] != target_tile:
                 continue
             
-            visited.add((x, y))
-            self.room.tiles[y][x] = replacement_tile
+            # Grow the seed into its whole run of target tiles, fill it in one go
+            x0 = x
+            while x0 > 0 and row[x0 - 1] == target_tile:
+                x0 -= 1
+            x1 = x
+            while x1 < width - 1 and row[x1 + 1] == target_tile:
+                x1 += 1
+            row[x0:x1 + 1] = bytes((replacement_tile,)) * (x1 - x0 + 1)
             
-            stack.extend([(x+1, y), (x-1, y), (x, y+1), (x, y-1)])
+            # One seed per run of target tiles touching it above and below
+            for ny in (y - 1, y + 1):
+                if not 0 <= ny < height:
+                    continue
+                near = tiles[ny]
+                x = x0
+                while x <= x1:
+                    if near[x] == target_tile:
+                        stack.append((x, ny))
+                        while x <= x1 and near[x] == target_tile:
+                            x += 1
+                    else:
+                        x += 1
         
         self.room.modified = True
     
@@ -1265,25 +1582,39 @@ class RoomEditor:
         """Draw rectangle of tiles."""
         min_x, max_x = min(x0, x1), max(x0, x1)
         min_y, max_y = min(y0, y1), max(y0, y1)
+        room = self.room
+        
+        # Clamp to the room; each row's span is then written as one slice
+        left, right = max(min_x, 0), min(max_x, room.width - 1)
+        top, bottom = max(min_y, 0), min(max_y, room.height - 1)
+        if left > right or top > bottom:
+            return
+        span = bytes((tile_type,)) * (right - left + 1)
         
         if filled:
-            for y in range(min_y, max_y + 1):
-                for x in range(min_x, max_x + 1):
-                    self.room.set_tile(x, y, tile_type)
+            rows = range(top, bottom + 1)
         else:
-            for x in range(min_x, max_x + 1):
-                self.room.set_tile(x, min_y, tile_type)
-                self.room.set_tile(x, max_y, tile_type)
-            for y in range(min_y, max_y + 1):
-                self.room.set_tile(min_x, y, tile_type)
-                self.room.set_tile(max_x, y, tile_type)
+            rows = [y for y in (min_y, max_y) if top <= y <= bottom]
+            # Side columns, where they fall inside the room
+            for x in {min_x, max_x}:
+                if left <= x <= right:
+                    for y in range(top, bottom + 1):
+                        room.set_tile(x, y, tile_type)
+        
+        for y in rows:
+            row = room.tiles[y]
+            if row[left:right + 1] != span:
+                row[left:right + 1] = span
+                room.modified = True
     
     def handle_events(self):
         """Handle input events."""
         mouse_pos = pygame.mouse.get_pos()
         mouse_clicked = False
         
-        for event in pygame.event.get():
+        events = pygame.event.get()
+        last = len(events) - 1
+        for i, event in enumerate(events):
             if event.type == pygame.QUIT:
                 self.running = False
                 if self.game:
@@ -1295,13 +1626,13 @@ class RoomEditor:
                 result = self.file_dialog.handle_event(event)
                 if result:
                     if self.file_dialog.save_mode:
-                        self.room.save(result)
-                        self.show_message(f"Saved: {os.path.basename(result)}")
+                        self.save_in_background(result)
                     else:
-                        self.room.load(result)
-                        self.width_input.set_value(self.room.width)
-                        self.height_input.set_value(self.room.height)
-                        self.show_message(f"Loaded: {os.path.basename(result)}")
+                        self.load_in_background(result)
+                continue
+            
+            # Edits made now would be overwritten when the load lands
+            if self._loading() and event.type != pygame.VIDEORESIZE:
                 continue
             
             # Entry editor
@@ -1329,15 +1660,14 @@ class RoomEditor:
                         
                         # 1. Check for Objects to remove (Planks, etc.)
                         removed_object = False
-                        world_x = (event.pos[0] - self.sidebar_width - self.camera_x) / self.zoom
-                        world_y = (event.pos[1] - self.toolbar_height - self.camera_y) / self.zoom
+                        world_x, world_y = self.screen_to_world(*event.pos)
                         mouse_rect = pygame.Rect(world_x, world_y, 1, 1)
                         
-                        for i, obj in enumerate(self.room.objects):
+                        for obj_idx, obj in enumerate(self.room.objects):
                             obj_rect = pygame.Rect(obj["x"], obj["y"], obj["w"], obj["h"])
                             if obj_rect.colliderect(mouse_rect):
                                 self.save_undo()
-                                self.room.objects.pop(i)
+                                self.room.objects.pop(obj_idx)
                                 self.show_message("Object removed")
                                 removed_object = True
                                 break
@@ -1421,8 +1751,7 @@ class RoomEditor:
                         elif self.tool == "platform":
                             # Add subgrid platform
                             # Snap to 8x8 grid
-                            world_x = (event.pos[0] - self.sidebar_width - self.camera_x) / self.zoom
-                            world_y = (event.pos[1] - self.toolbar_height - self.camera_y) / self.zoom
+                            world_x, world_y = self.screen_to_world(*event.pos)
                             
                             # Snap to specific requirements:
                             # X: Same as 32x32 blocks -> 32px snapping
@@ -1489,6 +1818,7 @@ class RoomEditor:
                                 for dy in range(2):
                                     for dx in range(2):
                                         self.room.set_tile(base_x + dx, base_y + dy, self.current_tile)
+                                self._last_painted_tile = (base_x, base_y, self.current_tile)
                             else:
                                 # Single tile paint (e.g. Spikes)
                                 # Should we remove objects here too? Maybe not enforced, but good for consistency
@@ -1500,6 +1830,7 @@ class RoomEditor:
                                 self._remove_objects_in_rect(pixel_area_rect)
                                 
                                 self.room.set_tile(tile_x, tile_y, self.current_tile)
+                                self._last_painted_tile = (tile_x, tile_y, self.current_tile)
                     
                     # Scroll to zoom
                     elif event.button == 4:  # Scroll up
@@ -1555,6 +1886,10 @@ class RoomEditor:
             
             elif event.type == pygame.MOUSEMOTION:
                 if self.dragging_camera:
+                    # The drag moves by the last position of a run of motion
+                    # events; painting still needs every position in between
+                    if i < last and events[i + 1].type == pygame.MOUSEMOTION:
+                        continue
                     dx = event.pos[0] - self.last_mouse_pos[0]
                     dy = event.pos[1] - self.last_mouse_pos[1]
                     self.camera_x += dx
@@ -1568,6 +1903,10 @@ class RoomEditor:
                         # Snap to even grid (32px)
                         base_x = (tile_x // 2) * 2
                         base_y = (tile_y // 2) * 2
+                        painted = (base_x, base_y, self.current_tile)
+                        if painted == self._last_painted_tile:
+                            continue
+                        self._last_painted_tile = painted
                         
                         # Auto-remove objects in this 32x32 area
                         pixel_area_rect = pygame.Rect(base_x * TILE_SIZE, base_y * TILE_SIZE, 32, 32)
@@ -1579,6 +1918,10 @@ class RoomEditor:
                                 self.room.set_tile(base_x + dx, base_y + dy, self.current_tile)
                     else:
                         # Single tile paint
+                        painted = (tile_x, tile_y, self.current_tile)
+                        if painted == self._last_painted_tile:
+                            continue
+                        self._last_painted_tile = painted
                         pixel_area_rect = pygame.Rect(tile_x * TILE_SIZE, tile_y * TILE_SIZE, 16, 16)
                         self._remove_objects_in_rect(pixel_area_rect)
                         self.room.set_tile(tile_x, tile_y, self.current_tile)
@@ -1663,7 +2006,7 @@ class RoomEditor:
                 self.screen = pygame.display.set_mode((event.w, event.h), pygame.RESIZABLE)
         
         # UI button updates
-        if not self.file_dialog.active:
+        if not self.file_dialog.active and not self._loading():
             # Tile buttons - Adjust for scroll
             header_h = 30
             start_y = self.toolbar_height + header_h - self.sidebar_scroll
@@ -1695,17 +2038,21 @@ class RoomEditor:
                 
                 btn.rect.y = original_y # Restore
             
-            # Tool buttons
-            for btn in self.tool_buttons:
-                if btn.update(mouse_pos, mouse_clicked):
-                    self.set_tool(btn.tool)
-            
-            # Action buttons
-            for btn in self.action_buttons:
-                btn.update(mouse_pos, mouse_clicked)
-            
-            self.resize_btn.update(mouse_pos, mouse_clicked)
-            self.exit_btn.update(mouse_pos, mouse_clicked)
+            # Toolbar: only the button under the mouse can be hovered or clicked
+            btn = self._toolbar_button_at(mouse_pos)
+            if self._toolbar_hovered is not None and self._toolbar_hovered is not btn:
+                self._toolbar_hovered.hovered = False
+            self._toolbar_hovered = btn
+            if btn is not None and btn.update(mouse_pos, mouse_clicked) and btn in self.tool_buttons:
+                self.set_tool(btn.tool)
+    
+    def _toolbar_button_at(self, pos):
+        """Toolbar button containing pos, or None."""
+        i = bisect_right(self._toolbar_lefts, pos[0]) - 1
+        if i >= 0 and self._toolbar_buttons[i].rect.collidepoint(pos):
+            return self._toolbar_buttons[i]
+        return None
+    
     def set_tool(self, tool):
         """Set current tool."""
         self.tool = tool
@@ -1730,9 +2077,13 @@ class RoomEditor:
         """Update editor state."""
         mouse_pos = pygame.mouse.get_pos()
         
+        self.finish_io()
+        
         self.width_input.update(dt)
         self.height_input.update(dt)
-        self.file_dialog.update(dt)
+        # Hidden dialogs are skipped outright rather than asked to do nothing
+        if self.file_dialog.active:
+            self.file_dialog.update(dt)
         
         # if self.entry_editor:
         #     self.entry_editor.update(dt, mouse_pos)
@@ -1753,11 +2104,12 @@ class RoomEditor:
         self.draw_ui()
         
         # Draw file dialog
-        self.file_dialog.draw(self.screen, self.font)
+        if self.file_dialog.active:
+            self.file_dialog.draw(self.screen, self.font)
         
         # Draw message
         if self.message_timer > 0:
-            msg_surf = self.font_large.render(self.message, True, COLOR_TEXT)
+            msg_surf = render_text(self.font_large, self.message, COLOR_TEXT)
             msg_rect = msg_surf.get_rect(centerx=self.screen.get_width() // 2 + self.sidebar_width // 2, 
                                         bottom=self.screen.get_height() - 20)
 
@@ -1766,6 +2118,38 @@ class RoomEditor:
         
         pygame.display.flip()
     
+    def _update_tile_surface(self):
+        """Bring the 1x tile surface in line with the room, redrawing only changed rows."""
+        room = self.room
+        size = (room.width * TILE_SIZE, room.height * TILE_SIZE)
+        if self._tile_surf is None or self._tile_surf.get_size() != size:
+            self._tile_surf = pygame.Surface(size).convert()
+            self._tile_rows = [None] * room.height
+            self._tile_version += 1
+        
+        # Tools and undo write room.tiles directly, so rows are compared by content
+        drawn = self._tile_rows
+        surf = self._tile_surf
+        row_size = (room.width * TILE_SIZE, TILE_SIZE)
+        for y, row in enumerate(room.tiles):
+            if drawn[y] == row:
+                continue
+            drawn[y] = row_bytes = bytes(row)
+            top = y * TILE_SIZE
+            self._tile_version += 1
+            
+            # The row's bytes as an 8-bit image paletted with the tile colors,
+            # scaled up to tile size: the whole row is colored in C
+            row_surf = pygame.image.frombuffer(row_bytes, (room.width, 1), "P")
+            row_surf.set_palette(TILE_COLOR_BY_TYPE)
+            surf.blit(pygame.transform.scale(row_surf, row_size), (0, top))
+            
+            # Platform indicator (Tile)
+            x = row_bytes.find(TILE_PLATFORM)
+            while x != -1:
+                surf.fill((150, 120, 70), (x * TILE_SIZE, top, TILE_SIZE, 4))
+                x = row_bytes.find(TILE_PLATFORM, x + 1)
+    
     def draw_canvas(self):
         """Draw the room canvas."""
         # Canvas background
@@ -1786,45 +2170,33 @@ class RoomEditor:
         end_x = min(self.room.width, int((canvas_rect.width - self.camera_x) / tile_size_zoomed) + 1)
         end_y = min(self.room.height, int((canvas_rect.height - self.camera_y) / tile_size_zoomed) + 1)
         
-        # Draw tiles
-        for y in range(start_y, end_y):
-            for x in range(start_x, end_x):
-                tile = self.room.tiles[y][x]
-                screen_x, screen_y = self.tile_to_screen(x, y)
-                
-                rect = pygame.Rect(screen_x, screen_y, 
-                                  tile_size_zoomed + 1, tile_size_zoomed + 1)
-                
-                if rect.right < self.sidebar_width or rect.left > self.screen.get_width():
-                    continue
-                if rect.bottom < self.toolbar_height or rect.top > self.screen.get_height():
-                    continue
-                
-                if self.room.tiles[y][x] == TILE_ICE:
-                    color = TILE_COLORS[TILE_ICE]
-                    pygame.draw.rect(self.screen, color, rect)
-                    continue
-
-                color = TILE_COLORS[tile]
-                pygame.draw.rect(self.screen, color, rect)
-                
-                # Platform and Objects
-                # Platform and Objects
-                for obj in self.room.objects:
-                    ox = obj["x"] * self.zoom + self.camera_x + self.sidebar_width
-                    oy = obj["y"] * self.zoom + self.camera_y + self.toolbar_height
-                    ow = obj["w"] * self.zoom
-                    oh = obj["h"] * self.zoom
-                    
-                    obj_rect = pygame.Rect(ox, oy, ow, oh)
-                    if obj["type"] == OBJ_PLATFORM:
-                         pygame.draw.rect(self.screen, (150, 120, 70), obj_rect)
-                         pygame.draw.rect(self.screen, (100, 80, 40), obj_rect, 2)
-                
-                # Platform indicator (Tile)
-                if tile == TILE_PLATFORM and self.zoom >= 0.5:
-                    top_rect = pygame.Rect(rect.x, rect.y, rect.width, max(2, 4 * self.zoom))
-                    pygame.draw.rect(self.screen, (150, 120, 70), top_rect)
+        # Draw tiles: the visible part of the cached 1x tile surface, scaled to the zoom
+        if start_x < end_x and start_y < end_y:
+            self._update_tile_surface()
+            x0, y0 = self.tile_to_screen(start_x, start_y)
+            x1, y1 = self.tile_to_screen(end_x, end_y)
+            area = (start_x * TILE_SIZE, start_y * TILE_SIZE,
+                    (end_x - start_x) * TILE_SIZE, (end_y - start_y) * TILE_SIZE)
+            if self.zoom == 1.0:
+                visible = self._tile_surf.subsurface(area)
+            else:
+                # Rescale only when the visible tiles, zoom or tile contents changed
+                scaled_size = (int(x1) - int(x0), int(y1) - int(y0))
+                key = (area, scaled_size, self._tile_version)
+                if key != self._scaled_key:
+                    self._scaled_surf = pygame.transform.scale(self._tile_surf.subsurface(area), scaled_size)
+                    self._scaled_key = key
+                visible = self._scaled_surf
+            self.screen.blit(visible, (int(x0), int(y0)))
+        
+        # Platform objects
+        for obj in self.room.objects:
+            if obj["type"] == OBJ_PLATFORM:
+                obj_rect = pygame.Rect(obj["x"] * self.zoom + self.camera_x + self.sidebar_width,
+                                       obj["y"] * self.zoom + self.camera_y + self.toolbar_height,
+                                       obj["w"] * self.zoom, obj["h"] * self.zoom)
+                pygame.draw.rect(self.screen, (150, 120, 70), obj_rect)
+                pygame.draw.rect(self.screen, (100, 80, 40), obj_rect, 2)
         
         # Draw grid
         if self.zoom >= 0.5:
@@ -1862,7 +2234,7 @@ class RoomEditor:
             
             # Label
             if self.zoom >= 0.8:
-                label_surf = self.font.render("SPAWN", True, (0, 0, 0))
+                label_surf = render_text(self.font, "SPAWN", (0, 0, 0))
                 label_rect = label_surf.get_rect(center=spawn_rect.center)
                 self.screen.blit(label_surf, label_rect)
         
@@ -1902,8 +2274,7 @@ class RoomEditor:
         if mouse_pos[0] > self.sidebar_width and mouse_pos[1] > self.toolbar_height:
             if self.tool == "platform":
                 # Platform cursor (32x16, snaps to 16px grid)
-                world_x = (mouse_pos[0] - self.sidebar_width - self.camera_x) / self.zoom
-                world_y = (mouse_pos[1] - self.toolbar_height - self.camera_y) / self.zoom
+                world_x, world_y = self.screen_to_world(*mouse_pos)
                 
                 # X: 32px snapping
                 grid_x = int(world_x // 32) * 32
@@ -1966,7 +2337,7 @@ class RoomEditor:
         # Sidebar Header
         header_h = 30
         pygame.draw.rect(self.screen, COLOR_PANEL, (0, self.toolbar_height, self.sidebar_width, header_h))
-        section_surf = self.font.render("ASSETS", True, COLOR_TEXT_DIM)
+        section_surf = render_text(self.font, "ASSETS", COLOR_TEXT_DIM)
         self.screen.blit(section_surf, (15, self.toolbar_height + 8))
         
         # Clip sidebar content
@@ -1996,35 +2367,40 @@ class RoomEditor:
         filename = os.path.basename(self.room.filename) if self.room.filename else "Untitled"
         if self.room.modified:
             filename += "*"
-        file_surf = self.font.render(filename, True, COLOR_TEXT)
+        file_surf = render_text(self.font, filename, COLOR_TEXT)
         self.screen.blit(file_surf, (15, info_y + 10))
         
         # Zoom
-        zoom_surf = self.font.render(f"Zoom: {self.zoom:.1f}x", True, COLOR_TEXT_DIM)
+        zoom_surf = render_text(self.font, f"Zoom: {self.zoom:.1f}x", COLOR_TEXT_DIM)
         self.screen.blit(zoom_surf, (15, info_y + 28))
         
         # Current tile/tool
-        tool_surf = self.font.render(f"Tool: {self.tool.capitalize()}", True, COLOR_TEXT_DIM)
+        tool_surf = render_text(self.font, f"Tool: {self.tool.capitalize()}", COLOR_TEXT_DIM)
         self.screen.blit(tool_surf, (15, info_y + 46))
         
         # Mouse pos if on canvas
         mouse_pos = pygame.mouse.get_pos()
         if mouse_pos[0] > self.sidebar_width and mouse_pos[1] > self.toolbar_height:
             tile_x, tile_y = self.screen_to_tile(*mouse_pos)
-            pos_surf = self.font.render(f"Tile: {tile_x}, {tile_y}", True, COLOR_TEXT_DIM)
+            pos_surf = render_text(self.font, f"Tile: {tile_x}, {tile_y}", COLOR_TEXT_DIM)
             self.screen.blit(pos_surf, (15, info_y + 64))
     
     def run(self):
         """Main loop."""
         self.center_view()
+        pygame.event.set_blocked(IGNORED_EVENTS)
         
         while self.running:
-            dt = self.clock.tick(60) / 1000.0
+            dt = self.clock.tick(self.target_fps) / 1000.0
             
             self.handle_events()
             self.update(dt)
             self.draw()
         
+        pygame.event.set_allowed(IGNORED_EVENTS)
+        # A save still being written must not be lost on exit
+        self.finish_io(wait=True)
+        self._io_pool.shutdown()
         # Only quit if running standalone
         if not self.game:
             pygame.quit()
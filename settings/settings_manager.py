@@ -1,7 +1,26 @@
 import json
 import os
+from functools import lru_cache
 import pygame
 
+# orjson is optional; fall back to the stdlib encoder/decoder without it
+try:
+    import orjson
+    
+    def _json_loads(data):
+        return orjson.loads(data)
+    
+    def _json_dumps(obj):
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+except ImportError:
+    orjson = None
+    
+    def _json_loads(data):
+        return json.loads(data)
+    
+    def _json_dumps(obj):
+        return json.dumps(obj, indent=2).encode()
+
 SETTINGS_FILE = os.path.join(os.path.dirname(__file__), "settings.json")
 
 DEFAULT_SETTINGS = {
@@ -72,8 +91,17 @@ def get_resolution_options():
 
 FPS_OPTIONS = [30, 60, 120, 144, 240, 0]  # 0 = unlimited
 
+@lru_cache(maxsize=256)
+def key_name(key_code):
+    """Readable upper-case name for a pygame key code"""
+    return pygame.key.name(key_code).upper()
+
 class SettingsManager:
     def __init__(self):
+        self._res_index = None
+        self._fps_index = None
+        # Set when set() was called with flush=False and nothing saved since
+        self._dirty = False
         self.settings = self.load()
         self._validate_resolution()
     
@@ -91,8 +119,8 @@ class SettingsManager:
     def load(self):
         if os.path.exists(SETTINGS_FILE):
             try:
-                with open(SETTINGS_FILE, "r") as f:
-                    loaded = json.load(f)
+                with open(SETTINGS_FILE, "rb") as f:
+                    loaded = _json_loads(f.read())
                     # Merge with defaults to handle new settings
                     return self._merge_defaults(loaded)
             except (json.JSONDecodeError, IOError):
@@ -112,8 +140,9 @@ class SettingsManager:
     
     def save(self):
         try:
-            with open(SETTINGS_FILE, "w") as f:
-                json.dump(self.settings, f, indent=2)
+            with open(SETTINGS_FILE, "wb") as f:
+                f.write(_json_dumps(self.settings))
+            self._dirty = False
         except IOError as e:
             print(f"Failed to save settings: {e}")
     
@@ -122,25 +151,39 @@ class SettingsManager:
             return self.settings.get(category, {})
         return self.settings.get(category, {}).get(key)
     
-    def set(self, category, key, value):
+    def set(self, category, key, value, flush=True):
+        """Change a setting; with flush=False the write waits for flush()"""
         if category not in self.settings:
             self.settings[category] = {}
         self.settings[category][key] = value
-        self.save()
+        if category == "video":
+            if key == "resolution":
+                self._res_index = None
+            elif key == "fps_cap":
+                self._fps_index = None
+        self._dirty = True
+        if flush:
+            self.save()
+    
+    def flush(self):
+        """Save if there are changes that have not been written yet"""
+        if self._dirty:
+            self.save()
     
     def get_key_name(self, key_code):
         """Convert pygame key code to readable name"""
-        return pygame.key.name(key_code).upper()
+        return key_name(key_code)
     
     def get_resolution_index(self):
-        current = tuple(self.settings["video"]["resolution"])
-        options = get_resolution_options()
-        if current in options:
-            return options.index(current)
-        return 0
+        if self._res_index is None:
+            current = tuple(self.settings["video"]["resolution"])
+            options = get_resolution_options()
+            self._res_index = options.index(current) if current in options else 0
+        return self._res_index
     
     def get_fps_index(self):
-        current = self.settings["video"]["fps_cap"]
-        if current in FPS_OPTIONS:
-            return FPS_OPTIONS.index(current)
-        return 1  # Default to 60
+        if self._fps_index is None:
+            current = self.settings["video"]["fps_cap"]
+            # Default to 60
+            self._fps_index = FPS_OPTIONS.index(current) if current in FPS_OPTIONS else 1
+        return self._fps_index